@@ -1,15 +1,25 @@
 """Configuration loader and validator for md2pdf"""
 
-import yaml
+import copy
+import mmap
 from pathlib import Path
 from typing import Dict, Any, Optional
 
 DEFAULT_CONFIG_PATH = Path(__file__).parent / "md2pdf.config.yaml"
 
+# Configs at least this large are memory-mapped instead of read
+_MMAP_MIN_SIZE = 4096
+
+# Parsed configs keyed by (resolved path, mtime_ns, size)
+_CONFIG_CACHE: Dict[tuple, Dict[str, Any]] = {}
+
 def load_config(config_path: Optional[Path] = None) -> Dict[str, Any]:
     """
     Load configuration from YAML file.
 
+    Parsed results are cached per file and reused until the file's
+    mtime or size changes. Each call returns an independent copy.
+
     Args:
         config_path: Path to config file. Uses default if None.
 
@@ -23,13 +33,41 @@ def load_config(config_path: Optional[Path] = None) -> Dict[str, Any]:
     if config_path is None:
         config_path = DEFAULT_CONFIG_PATH
 
-    if not config_path.exists():
+    try:
+        st = config_path.stat()
+    except FileNotFoundError:
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
-    with open(config_path, 'r', encoding='utf-8') as f:
-        config = yaml.safe_load(f)
+    key = (config_path.resolve(), st.st_mtime_ns, st.st_size)
+    if key not in _CONFIG_CACHE:
+        # PyYAML is imported on first parse to keep CLI startup light.
+        # Prefer the libyaml-backed loader; fall back to pure Python if unavailable
+        import yaml
+        loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+        if st.st_size >= _MMAP_MIN_SIZE:
+            with open(config_path, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                _CONFIG_CACHE[key] = yaml.load(mm, Loader=loader)
+        else:
+            with open(config_path, 'r', encoding='utf-8') as f:
+                _CONFIG_CACHE[key] = yaml.load(f, Loader=loader)
+
+    return copy.deepcopy(_CONFIG_CACHE[key])
 
-    return config
+
+load_config.cache_clear = _CONFIG_CACHE.clear
+
+
+# Required structure checked by validate_config
+_REQUIRED_SECTION_KEYS = {
+    'output': frozenset({'format', 'default_theme'}),
+    'pdf_options': frozenset({'page_size', 'margins'}),
+    'rendering': frozenset({'math_engine', 'mermaid_theme'}),
+    'themes': frozenset(),
+}
+_REQUIRED_KEYS = frozenset(_REQUIRED_SECTION_KEYS)
+_OUTPUT_FORMATS = ('pdf', 'html')
 
 
 def validate_config(config: Dict[str, Any]) -> bool:
@@ -43,39 +81,16 @@ def validate_config(config: Dict[str, Any]) -> bool:
         True if valid, False otherwise
     """
     # Check top-level keys
-    required_keys = ['output', 'pdf_options', 'rendering', 'themes']
-    if not all(k in config for k in required_keys):
+    if not _REQUIRED_KEYS.issubset(config):
         return False
 
-    # Validate output section
-    output = config.get('output', {})
-    if not isinstance(output, dict):
-        return False
-    if 'format' not in output or 'default_theme' not in output:
-        return False
-    if output['format'] not in ['pdf', 'html']:
-        return False
-
-    # Validate pdf_options section
-    pdf_opts = config.get('pdf_options', {})
-    if not isinstance(pdf_opts, dict):
-        return False
-    if 'page_size' not in pdf_opts or 'margins' not in pdf_opts:
-        return False
-
-    # Validate rendering section
-    rendering = config.get('rendering', {})
-    if not isinstance(rendering, dict):
-        return False
-    if 'math_engine' not in rendering or 'mermaid_theme' not in rendering:
-        return False
-
-    # Validate themes section
-    themes = config.get('themes', {})
-    if not isinstance(themes, dict):
-        return False
+    # Validate each section's type and required keys
+    for section, keys in _REQUIRED_SECTION_KEYS.items():
+        value = config[section]
+        if not isinstance(value, dict) or not keys.issubset(value):
+            return False
 
-    return True
+    return config['output']['format'] in _OUTPUT_FORMATS
 
 
 def get_theme_config(theme_name: str, config: Dict[str, Any]) -> Dict[str, Any]:
@@ -1,10 +1,90 @@
 """HTML document builder for md2pdf."""
 
+from functools import lru_cache
 from pathlib import Path
-from jinja2 import Template
-from markdown_renderer import render_markdown, extract_title
 from theme_manager import load_theme_css, ThemeManager
-from typing import Dict, Any
+from typing import TYPE_CHECKING, Dict, Any, NamedTuple, Optional
+
+if TYPE_CHECKING:
+    from jinja2 import Template
+
+TEMPLATE_PATH = Path(__file__).parent / "templates" / "base.html"
+
+# ThemeManager shared by consecutive builds that use the same config
+_theme_manager: Optional[ThemeManager] = None
+
+
+def _get_theme_manager(config: Dict[str, Any]) -> ThemeManager:
+    """Return a ThemeManager for config, reusing the last one if config is unchanged."""
+    global _theme_manager
+    if _theme_manager is None or _theme_manager.config is not config:
+        _theme_manager = ThemeManager(config)
+    return _theme_manager
+
+
+@lru_cache(maxsize=4)
+def _get_template(path: str, mtime_ns: int) -> "Template":
+    """Compile a template once per (path, mtime) pair."""
+    from jinja2 import Template
+
+    return Template(Path(path).read_text(encoding='utf-8'))
+
+
+class ThemeContext(NamedTuple):
+    """Per-theme inputs to the document template, shared by every file in a batch."""
+    theme_css: str
+    mermaid_theme: str
+    template_mtime_ns: int
+
+
+def prepare_theme_context(theme_name: str, config: Dict[str, Any]) -> ThemeContext:
+    """
+    Resolve everything a document needs from its theme, once per batch.
+
+    Args:
+        theme_name: Theme name (e.g., 'academic')
+        config: Configuration dictionary
+
+    Returns:
+        ThemeContext for render_document
+    """
+    return ThemeContext(
+        theme_css=load_theme_css(theme_name),
+        mermaid_theme=_get_theme_manager(config).get_mermaid_theme(theme_name),
+        template_mtime_ns=TEMPLATE_PATH.stat().st_mtime_ns,
+    )
+
+
+def render_document(md_content: str, context: ThemeContext) -> str:
+    """
+    Build complete HTML document from markdown with a prepared theme.
+
+    Args:
+        md_content: Markdown content
+        context: Theme context from prepare_theme_context
+
+    Returns:
+        Complete HTML document string
+    """
+    # Imported here so CLI startup doesn't pay for markdown-it-py
+    from markdown_renderer import render_markdown, extract_title
+
+    # Extract title from markdown
+    title = extract_title(md_content)
+
+    # Render markdown to HTML
+    content_html = render_markdown(md_content)
+
+    # Load template (compiled once, recompiled if the file changes)
+    template = _get_template(str(TEMPLATE_PATH), context.template_mtime_ns)
+
+    # Render complete document
+    return template.render(
+        title=title,
+        theme_css=context.theme_css,
+        mermaid_theme=context.mermaid_theme,
+        content=content_html
+    )
 
 
 def build_html_document(
@@ -29,30 +109,4 @@ def build_html_document(
         >>> '<!DOCTYPE html>' in html
         True
     """
-    # Extract title from markdown
-    title = extract_title(md_content)
-
-    # Render markdown to HTML
-    content_html = render_markdown(md_content)
-
-    # Load theme CSS
-    theme_css = load_theme_css(theme_name)
-
-    # Get mermaid theme
-    theme_manager = ThemeManager(config)
-    mermaid_theme = theme_manager.get_mermaid_theme(theme_name)
-
-    # Load template
-    template_path = Path(__file__).parent / "templates" / "base.html"
-    template_content = template_path.read_text(encoding='utf-8')
-    template = Template(template_content)
-
-    # Render complete document
-    html = template.render(
-        title=title,
-        theme_css=theme_css,
-        mermaid_theme=mermaid_theme,
-        content=content_html
-    )
-
-    return html
+    return render_document(md_content, prepare_theme_context(theme_name, config))
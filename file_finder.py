@@ -0,0 +1,282 @@
+"""
+File Finder Module
+
+Expands file paths and glob patterns to input files and reads them,
+for both CLIs.
+"""
+
+import fnmatch
+import glob
+import mmap
+import os
+import re
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Collection, Dict, FrozenSet, Iterator, List, Optional, Tuple, Union
+
+# A compiled wildcard segment: (name matcher, whether hidden names may match)
+Wildcard = Tuple[Callable[[str], Optional[re.Match]], bool]
+
+# Pattern segment: literal name, RECURSIVE for "**", or a compiled wildcard
+Segment = Union[str, object, Wildcard]
+
+RECURSIVE = object()
+
+# Directories never entered when expanding "**" (hidden ones are skipped too)
+IGNORED_DIRS = frozenset({'node_modules', '__pycache__'})
+
+# A directory entry as (name, is_dir, is_file, is_symlink); is_dir and
+# is_file follow symlinks
+Entry = Tuple[str, bool, bool, bool]
+
+# Directory listings keyed by path, stored with the directory's (inode, mtime_ns)
+Listings = Dict[str, Tuple[Tuple[int, int], List[Entry]]]
+
+# Directories modified this recently are not cached: a change within the
+# same filesystem timestamp tick would leave their mtime unchanged
+_LISTING_RACY_NS = 1_000_000_000
+
+# Markdown files at least this large are memory-mapped instead of read
+MMAP_READ_THRESHOLD = 256 * 1024
+
+
+def glob_files(
+    pattern: str,
+    extensions: Optional[Collection[str]] = None,
+    ignore_dirs: Collection[str] = IGNORED_DIRS,
+    listings: Optional[Listings] = None
+) -> List[Path]:
+    """
+    Find files matching glob pattern.
+
+    Args:
+        pattern: Glob pattern (e.g., "*.md", "docs/**/*.md")
+        extensions: Lowercase suffixes to keep (e.g., {'.md'}); names are
+            filtered before any file-type check. None keeps every file.
+        ignore_dirs: Directory names "**" never descends into
+        listings: Directory listings to share between calls (e.g. across a
+            prompt's retries); each is reused while its directory's mtime is
+            unchanged. None keeps them for this call only.
+
+    Returns:
+        List of matching file paths
+
+    Examples:
+        >>> glob_files("*.md")
+        [Path("readme.md"), Path("notes.md")]
+
+        >>> glob_files("docs/**/*.md")  # Recursive
+        [Path("docs/guide.md"), Path("docs/api/reference.md")]
+    """
+    # Check if it's a direct file path first
+    direct_path = Path(pattern)
+    if direct_path.is_file():
+        if not _has_extension(direct_path.name, extensions):
+            return []
+        return [direct_path]
+
+    if not glob.has_magic(pattern):
+        return []
+
+    # Split off the literal directory prefix, then walk the rest with scandir;
+    # only the wildcarded tail is ever matched against directory entries
+    if os.altsep:
+        pattern = pattern.replace(os.altsep, os.sep)
+    parts = pattern.split(os.sep)
+    literal = 0
+    while literal < len(parts) - 1 and not glob.has_magic(parts[literal]):
+        literal += 1
+    base = os.sep.join(parts[:literal]) or (os.sep if pattern.startswith(os.sep) else '')
+
+    # Adjacent "**" segments match the same paths as one
+    segments = []
+    for part in parts[literal:]:
+        segment = _compile_segment(part)
+        if not (segment is RECURSIVE and segments and segments[-1] is RECURSIVE):
+            segments.append(segment)
+
+    if listings is None:
+        listings = {}
+    matches = _scan_files(base, segments, extensions, ignore_dirs, listings)
+    if sum(segment is RECURSIVE for segment in segments) > 1:
+        # Separate "**" segments can reach a file by more than one route;
+        # dedupe the strings before any Path is built
+        matches = dict.fromkeys(matches)
+
+    # Sort once at the end, keyed on the same case-normalised parts that
+    # Path comparison uses, but without going through PurePath.__lt__
+    files = [Path(m) for m in matches]
+    files.sort(key=_sort_key)
+    return files
+
+
+def _sort_key(path: Path) -> List[str]:
+    """Order paths as Path comparison does: by case-normalised components."""
+    return os.path.normcase(str(path)).split(os.sep)
+
+
+@lru_cache(maxsize=256)
+def _compile_segment(part: str) -> Segment:
+    """
+    Compile one pattern component.
+
+    Compiled once per distinct component rather than per directory entry,
+    and cached across calls so repeated patterns skip fnmatch translation.
+    """
+    if part == '**':
+        return RECURSIVE
+    if not glob.has_magic(part):
+        return part
+    regex = re.compile(fnmatch.translate(os.path.normcase(part)))
+    return (regex.match, part.startswith('.'))
+
+
+def _has_extension(name: str, extensions: Optional[Collection[str]]) -> bool:
+    """Check a file name's suffix against lowercase extensions (None matches all)."""
+    return extensions is None or os.path.splitext(name)[1].lower() in extensions
+
+
+def _scan_files(
+    directory: str,
+    segments: List[Segment],
+    extensions: Optional[Collection[str]],
+    ignore_dirs: Collection[str],
+    listings: Listings
+) -> Iterator[str]:
+    """
+    Yield files under directory matching the remaining pattern segments.
+
+    Mirrors glob.glob(..., recursive=True) for files, but takes file and
+    directory types from os.scandir entries instead of stat-ing each match.
+    Names without one of the given extensions are dropped before any
+    file-type check, and "**" prunes ignored directories without
+    listing them.
+    """
+    segment, rest = segments[0], segments[1:]
+
+    if isinstance(segment, str):
+        # Literal component (or a trailing separator, which only matches directories)
+        if segment:
+            path = os.path.join(directory, segment)
+            if rest:
+                yield from _scan_files(path, rest, extensions, ignore_dirs, listings)
+            elif _has_extension(segment, extensions) and os.path.isfile(path):
+                yield path
+        return
+
+    try:
+        entries = _list_dir(directory or os.curdir, listings)
+    except OSError:
+        return
+
+    if segment is RECURSIVE:
+        # Matches zero or more directories
+        if rest:
+            yield from _scan_files(directory, rest, extensions, ignore_dirs, listings)
+        for name, is_dir, is_file, is_symlink in entries:
+            if name.startswith('.'):
+                continue
+            path = os.path.join(directory, name) if directory else name
+            # Symlinked directories are not descended into (as with
+            # Path.rglob), so link cycles cannot recurse forever
+            if is_dir and not is_symlink:
+                if name not in ignore_dirs:
+                    yield from _scan_files(path, segments, extensions, ignore_dirs, listings)
+            elif not rest and is_file and _has_extension(name, extensions):
+                yield path
+        return
+
+    match, allow_hidden = segment
+    for name, is_dir, is_file, _ in entries:
+        if name.startswith('.') and not allow_hidden:
+            continue
+        if not match(os.path.normcase(name)):
+            continue
+        path = os.path.join(directory, name) if directory else name
+        if rest:
+            if is_dir:
+                yield from _scan_files(path, rest, extensions, ignore_dirs, listings)
+        elif is_file and _has_extension(name, extensions):
+            yield path
+
+
+def _list_dir(directory: str, listings: Listings) -> List[Entry]:
+    """
+    List a directory, reusing its entry in listings while its mtime is unchanged.
+
+    Adding, removing or renaming an entry updates the directory's mtime,
+    so a repeated glob costs one stat per directory instead of a scandir.
+    Entry types are captured as plain values when listed, and listings
+    only live as long as the caller keeps them.
+    """
+    st = os.stat(directory)
+    stamp = (st.st_ino, st.st_mtime_ns)
+    cached = listings.get(directory)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    # is_dir/is_file/is_symlink come from the readdir d_type, so only
+    # symlinks (and filesystems without d_type) need a stat here
+    with os.scandir(directory) as it:
+        entries = [
+            (entry.name, _is_dir(entry), _is_file(entry), entry.is_symlink())
+            for entry in it
+        ]
+    if time.time_ns() - st.st_mtime_ns > _LISTING_RACY_NS:
+        listings[directory] = (stamp, entries)
+    return entries
+
+
+def _is_dir(entry: os.DirEntry) -> bool:
+    """DirEntry.is_dir(), treating a vanished or unreadable target as not a directory."""
+    try:
+        return entry.is_dir()
+    except OSError:
+        return False
+
+
+def _is_file(entry: os.DirEntry) -> bool:
+    """DirEntry.is_file(), treating a vanished or unreadable target as not a file."""
+    try:
+        return entry.is_file()
+    except OSError:
+        return False
+
+
+def ignore_dirs_from_config(config: dict) -> FrozenSet[str]:
+    """
+    Get the directory names to prune from the files.ignore_dirs config key.
+
+    An empty files section falls back to IGNORED_DIRS.
+
+    Raises:
+        ValueError: If ignore_dirs is not a list of directory names
+    """
+    ignore_dirs = (config.get('files') or {}).get('ignore_dirs', IGNORED_DIRS)
+    if (not isinstance(ignore_dirs, (list, tuple, set, frozenset))
+            or not all(isinstance(name, str) for name in ignore_dirs)):
+        raise ValueError(
+            f"files.ignore_dirs must be a list of directory names, got: {ignore_dirs!r}"
+        )
+    return frozenset(ignore_dirs)
+
+
+def read_markdown(md_file: Path) -> str:
+    """
+    Read a markdown file as text.
+
+    Large files are memory-mapped and decoded straight from the mapping,
+    so the raw bytes are never copied onto the heap alongside the str.
+    Either way, line endings are translated to '\n' as read_text does.
+    """
+    if md_file.stat().st_size < MMAP_READ_THRESHOLD:
+        return md_file.read_text(encoding='utf-8')
+
+    with open(md_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if hasattr(mm, 'madvise'):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        text = str(mm, 'utf-8')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
@@ -12,73 +12,75 @@ Usage:
 """
 
 import json
+import re
 import subprocess
 import sys
+import tempfile
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-
-def run_gh_command(args: list[str]) -> dict[str, Any] | list[Any]:
-    """Run gh CLI command and return JSON output."""
-    result = subprocess.run(
-        ["gh"] + args,
-        capture_output=True,
-        text=True,
-        check=True,
-    )
-    return json.loads(result.stdout)
+GEMINI_BOT_LOGIN = "gemini-code-assist[bot]"
+
+SEVERITY_RE = re.compile(r"\b(high|medium|low)\b", re.IGNORECASE)
+BADGE_RE = re.compile(
+    r"!\[(?:high|medium|low)\]\(https://www\.gstatic\.com/codereviewagent/[a-z-]+\.svg\)"
+)
+SUGGESTION_RE = re.compile(r"^[ \t]*```suggestion.*?^[ \t]*```[ \t]*$\n?", re.MULTILINE | re.DOTALL)
+NOT_ADDRESSED_RE = re.compile(r"^[ \t]*## Not Addressed \(Needs Review\)[ \t]*$", re.MULTILINE)
+BLANK_LINE_RE = re.compile(r"\n[ \t]*\n")
+LAST_REVIEW_RE = re.compile(r"^\*\*Last Review:\*\*.*$", re.MULTILINE)
+
+
+def run_gh_json_lines(args: list[str]) -> list[Any]:
+    """
+    Run gh CLI command whose --jq filter emits one JSON value per line.
+
+    Each line is decoded straight from the binary pipe as gh writes it,
+    instead of buffering and text-decoding the whole output first.
+    stderr goes to a temporary file rather than a second pipe, so gh can
+    never block on a full stderr pipe while stdout is being read.
+    """
+    cmd = ["gh"] + args
+    with tempfile.TemporaryFile() as errors:
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=errors) as proc:
+            values = [json.loads(line) for line in proc.stdout if line.strip()]
+        errors.seek(0)
+        stderr = errors.read()
+
+    if proc.returncode:
+        raise subprocess.CalledProcessError(
+            proc.returncode, cmd, output="", stderr=stderr.decode("utf-8", "replace")
+        )
+    return values
 
 
 def fetch_gemini_review_comments(pr_number: int) -> list[dict[str, Any]]:
-    """Fetch Gemini code review comments from a PR."""
-    comments = run_gh_command([
+    """
+    Fetch Gemini code review comments from a PR.
+
+    Follows every page (100 comments per request) and lets gh's --jq
+    filter keep only Gemini bot comments before they reach Python.
+    """
+    return run_gh_json_lines([
         "api",
-        f"repos/Neikan-BSN/projects/pulls/{pr_number}/comments",
+        "--paginate",
+        f"repos/Neikan-BSN/projects/pulls/{pr_number}/comments?per_page=100",
+        "--jq",
+        f'.[] | select(.user.login == "{GEMINI_BOT_LOGIN}")',
     ])
 
-    # Filter for Gemini bot comments only
-    gemini_comments = [
-        c for c in comments
-        if c["user"]["login"] == "gemini-code-assist[bot]"
-    ]
-
-    return gemini_comments
-
 
 def parse_severity(comment_body: str) -> str:
-    """Extract severity level from comment body."""
-    if "high" in comment_body.lower():
-        return "HIGH"
-    elif "medium" in comment_body.lower():
-        return "MEDIUM"
-    elif "low" in comment_body.lower():
-        return "LOW"
-    return "UNSPECIFIED"
+    """Extract severity level from comment body (first badge/keyword wins)."""
+    match = SEVERITY_RE.search(comment_body)
+    return match.group(1).upper() if match else "UNSPECIFIED"
 
 
 def extract_recommendation(comment: dict[str, Any]) -> dict[str, str]:
     """Extract recommendation details from comment."""
-    body = comment["body"]
-
-    # Remove severity badge markup
-    body = body.replace("![high](https://www.gstatic.com/codereviewagent/high-priority.svg)", "")
-    body = body.replace("![medium](https://www.gstatic.com/codereviewagent/medium-priority.svg)", "")
-    body = body.replace("![low](https://www.gstatic.com/codereviewagent/low-priority.svg)", "")
-
-    # Remove suggestion blocks (code suggestions)
-    lines = body.split("\n")
-    cleaned_lines = []
-    in_suggestion = False
-    for line in lines:
-        if line.strip().startswith("```suggestion"):
-            in_suggestion = True
-        elif line.strip() == "```" and in_suggestion:
-            in_suggestion = False
-        elif not in_suggestion:
-            cleaned_lines.append(line)
-
-    body = "\n".join(cleaned_lines).strip()
+    # Remove severity badge markup and suggestion blocks (code suggestions)
+    body = SUGGESTION_RE.sub("", BADGE_RE.sub("", comment["body"])).strip()
 
     return {
         "severity": parse_severity(comment["body"]),
@@ -138,23 +140,16 @@ def append_to_recommendations(
         print("   Please review and disposition existing items first.")
         return
 
-    # Find insertion point (after "## Not Addressed (Needs Review)")
-    lines = content.split("\n")
-    insertion_idx = None
+    # Find insertion point (line after the first blank line below the header)
+    header = NOT_ADDRESSED_RE.search(content)
+    blank = BLANK_LINE_RE.search(content, header.end()) if header else None
 
-    for i, line in enumerate(lines):
-        if line.strip() == "## Not Addressed (Needs Review)":
-            # Find next blank line after header
-            for j in range(i + 1, len(lines)):
-                if lines[j].strip() == "":
-                    insertion_idx = j + 1
-                    break
-            break
-
-    if insertion_idx is None:
+    if blank is None:
         print("❌ Could not find 'Not Addressed' section in file")
         return
 
+    insertion_offset = blank.end()
+
     # Build new section
     new_section = [f"\n{pr_section}\n"]
     for i, rec in enumerate(recommendations, 1):
@@ -163,17 +158,20 @@ def append_to_recommendations(
         new_section.append(f"   - File: `{rec['file']}:{rec['line']}`")
         new_section.append("")
 
-    # Insert new section
-    lines[insertion_idx:insertion_idx] = new_section
+    # Splice new section into the original text
+    content = (
+        content[:insertion_offset]
+        + "\n".join(new_section) + "\n"
+        + content[insertion_offset:]
+    )
 
     # Update last review date
-    for i, line in enumerate(lines):
-        if line.startswith("**Last Review:**"):
-            lines[i] = f"**Last Review:** {datetime.now().strftime('%Y-%m-%d')}"
-            break
+    content = LAST_REVIEW_RE.sub(
+        f"**Last Review:** {datetime.now().strftime('%Y-%m-%d')}", content, count=1
+    )
 
     # Write back
-    recommendations_file.write_text("\n".join(lines))
+    recommendations_file.write_text(content)
     print(f"✅ Added {len(recommendations)} recommendations for PR #{pr_number}")
     print(f"   File: {recommendations_file}")
 
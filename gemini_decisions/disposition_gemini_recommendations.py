@@ -10,6 +10,7 @@ Usage:
     python disposition_gemini_recommendations.py --pr 23
 """
 
+import os
 import re
 import sys
 from datetime import datetime
@@ -28,79 +29,143 @@ class RecommendationDispositioner:
         "rejected": "## Rejected (YAGNI / Over-Engineering)",
     }
 
+    CHOICES = frozenset({"I", "D", "R", "A", "S", "Q"})
+
+    DISPOSITIONS = {
+        "I": "IMPLEMENT",
+        "D": "DEFER",
+        "R": "REJECT",
+        "A": "ALREADY_IMPLEMENTED",
+    }
+
+    DISPOSITION_SECTIONS = {
+        "IMPLEMENT": "approved",
+        "DEFER": "deferred",
+        "REJECT": "rejected",
+        "ALREADY_IMPLEMENTED": "already_implemented",
+    }
+
+    DISPOSITION_EMOJI = {
+        "IMPLEMENT": "✅",
+        "DEFER": "⚠️",
+        "REJECT": "❌",
+        "ALREADY_IMPLEMENTED": "✅",
+    }
+
+    # Patterns operate on the raw UTF-8 buffer (see __init__)
+    SECTION_RES = {
+        key: re.compile(rb"^[ \t]*" + re.escape(header.encode()) + rb"[ \t]*\r?$", re.MULTILINE)
+        for key, header in SECTIONS.items()
+    }
+
+    SECTION_END_RE = re.compile(rb"^## ", re.MULTILINE)
+    HEADING_RE = re.compile(rb"^##.*$", re.MULTILINE)
+    LAST_REVIEW_RE = re.compile(rb"^\*\*Last Review:\*\*.*$", re.MULTILINE)
+    PR_RE = re.compile(rb"^### PR #(\d+)", re.MULTILINE)
+    PR_HEADER_RE = re.compile(rb"### PR #(\d+)")
+    ITEM_RE = re.compile(
+        rb"^(\d+)\.[ \t]+(.*?)(?=^\d+\.[ \t]|^#|^---|\Z)", re.MULTILINE | re.DOTALL
+    )
+
     def __init__(self, recommendations_file: Path):
         self.recommendations_file = recommendations_file
-        self.content = recommendations_file.read_text()
-        self.lines = self.content.split("\n")
+        # Held as one mutable byte buffer; edits are in-place slice assignments
+        self.buf = bytearray(recommendations_file.read_bytes())
+        self._items: list[dict] = []
+        self._anchors: dict[str, dict] = {}
+        self._pending: list[tuple[dict, str, str]] = []
+        self._dirty = False
 
     def parse_not_addressed_items(
         self, pr_filter: Optional[int] = None
     ) -> dict[str, list[dict]]:
-        """Parse all items in 'Not Addressed' section."""
+        """
+        Parse all items in 'Not Addressed' section.
+
+        Each item records its byte span (``start``/``end``) in
+        ``self.buf`` so it can be spliced out without re-scanning.
+        """
         items_by_pr = {}
-        current_pr = None
-        current_item = None
-        in_section = False
-
-        for i, line in enumerate(self.lines):
-            # Detect section boundaries
-            if line.strip() == self.SECTIONS["not_addressed"]:
-                in_section = True
-                continue
-            elif line.startswith("##") and in_section:
-                # End of Not Addressed section
-                break
+        self._items = []
 
-            if not in_section:
-                continue
+        header = self.SECTION_RES["not_addressed"].search(self.buf)
+        if header is None:
+            return items_by_pr
 
-            # Detect PR subsection
-            pr_match = re.match(r"^### PR #(\d+)", line)
-            if pr_match:
-                current_pr = int(pr_match.group(1))
-                if pr_filter is None or current_pr == pr_filter:
-                    items_by_pr[current_pr] = []
-                else:
-                    current_pr = None
-                continue
+        section_start = header.end()
+        next_section = self.SECTION_END_RE.search(self.buf, section_start)
+        section_end = next_section.start() if next_section else len(self.buf)
 
-            if current_pr is None:
+        pr_matches = list(self.PR_RE.finditer(self.buf, section_start, section_end))
+        for idx, pr_match in enumerate(pr_matches):
+            pr = int(pr_match.group(1))
+            if pr_filter is not None and pr != pr_filter:
                 continue
 
-            # Detect recommendation item
-            item_match = re.match(r"^(\d+)\.\s+(.+)", line)
-            if item_match:
-                # Save previous item if exists
-                if current_item:
-                    items_by_pr[current_pr].append(current_item)
-
-                # Start new item
-                item_num = int(item_match.group(1))
-                body = item_match.group(2)
-                current_item = {
-                    "pr": current_pr,
-                    "number": item_num,
-                    "body": body,
-                    "details": [],
-                    "start_line": i,
-                    "end_line": i,
+            pr_end = pr_matches[idx + 1].start() if idx + 1 < len(pr_matches) else section_end
+            items = items_by_pr.setdefault(pr, [])
+
+            for item_match in self.ITEM_RE.finditer(self.buf, pr_match.end(), pr_end):
+                body_lines = []
+                details = []
+                for line in item_match.group(2).decode("utf-8").split("\n"):
+                    stripped = line.strip()
+                    if stripped.startswith("-"):
+                        details.append(stripped)
+                    else:
+                        body_lines.append(line)
+
+                item = {
+                    "pr": pr,
+                    "number": int(item_match.group(1)),
+                    "body": "\n".join(body_lines).strip(),
+                    "details": details,
+                    "start": item_match.start(),
+                    "end": item_match.end(),
                 }
-            elif current_item and line.strip().startswith("-"):
-                # Additional details for current item
-                current_item["details"].append(line.strip())
-                current_item["end_line"] = i
-            elif current_item and not line.strip():
-                # End of current item
-                current_item["end_line"] = i
-                items_by_pr[current_pr].append(current_item)
-                current_item = None
-
-        # Add final item if exists
-        if current_item:
-            items_by_pr[current_pr].append(current_item)
+                items.append(item)
+                self._items.append(item)
 
+        self._build_index()
         return items_by_pr
 
+    def _build_index(self) -> None:
+        """
+        Record where each target section's leading PR block starts and ends.
+
+        Anchors are kept in step with edits by ``_splice`` so moving an item
+        never has to re-scan the file for its target section.
+        """
+        self._anchors = {}
+        for key, pattern in self.SECTION_RES.items():
+            if key == "not_addressed":
+                continue
+            section = pattern.search(self.buf)
+            if section is None:
+                continue
+
+            # None marks end of file; resolved against the buffer at use time
+            anchor = {"pr": None, "start": None, "end": None}
+            heading = self.HEADING_RE.search(self.buf, section.end())
+            if heading is not None:
+                anchor["start"] = anchor["end"] = heading.start()
+                pr_match = self.PR_HEADER_RE.fullmatch(heading.group().strip())
+                if pr_match:
+                    anchor["pr"] = int(pr_match.group(1))
+                    next_heading = self.HEADING_RE.search(self.buf, heading.end())
+                    anchor["end"] = next_heading.start() if next_heading else None
+            self._anchors[key] = anchor
+
+    def _splice(self, start: int, end: int, data: bytes) -> None:
+        """Replace ``buf[start:end]`` with data and shift tracked spans and anchors."""
+        self.buf[start:end] = data
+        self._dirty = True
+        delta = len(data) - (end - start)
+        for span in (*self._items, *self._anchors.values()):
+            for field in ("start", "end"):
+                if span[field] is not None and span[field] >= end:
+                    span[field] += delta
+
     def get_disposition_choice(self, item: dict) -> tuple[str, str]:
         """Prompt user for disposition choice."""
         print("\n" + "=" * 80)
@@ -121,7 +186,7 @@ class RecommendationDispositioner:
         while True:
             choice = input("\nYour choice [I/D/R/A/S/Q]: ").strip().upper()
 
-            if choice in ["I", "D", "R", "A", "S", "Q"]:
+            if choice in self.CHOICES:
                 break
             print("Invalid choice. Please enter I, D, R, A, S, or Q.")
 
@@ -142,96 +207,106 @@ class RecommendationDispositioner:
             scope = input("> ").strip()
 
         # Build decision text
-        disposition_map = {
-            "I": "IMPLEMENT",
-            "D": "DEFER",
-            "R": "REJECT",
-            "A": "ALREADY_IMPLEMENTED",
-        }
-
-        decision_text = f"**Decision:** {disposition_map[choice]}"
+        disposition = self.DISPOSITIONS[choice]
+        decision_text = f"**Decision:** {disposition}"
         if rationale:
             decision_text += f"\n   - **Rationale:** {rationale}"
         if scope:
             decision_text += f"\n   - **Scope:** {scope}"
 
-        return disposition_map[choice], decision_text
+        return disposition, decision_text
 
     def move_item_to_section(
         self, item: dict, target_section: str, decision_text: str
     ) -> None:
-        """Move item from 'Not Addressed' to target section."""
-        # Remove from current location
-        del self.lines[item["start_line"] : item["end_line"] + 1]
-
-        # Find target section insertion point
-        target_header = self.SECTIONS[target_section]
-        insertion_idx = None
-
-        for i, line in enumerate(self.lines):
-            if line.strip() == target_header:
-                # Find subsection for this PR
-                pr_header = f"### PR #{item['pr']}"
-                for j in range(i + 1, len(self.lines)):
-                    if self.lines[j].strip() == pr_header:
-                        # Insert after existing PR items
-                        for k in range(j + 1, len(self.lines)):
-                            if self.lines[k].startswith("###") or self.lines[k].startswith("##"):
-                                insertion_idx = k
-                                break
-                        if insertion_idx is None:
-                            insertion_idx = len(self.lines)
-                        break
-                    elif self.lines[j].startswith("##"):
-                        # No existing PR section, create one
-                        insertion_idx = j
-                        break
-
-                if insertion_idx is None:
-                    # Section exists but no content
-                    insertion_idx = i + 2
-
-                break
-
-        if insertion_idx is None:
-            print(f"⚠️  Could not find section: {target_header}")
+        """
+        Queue item to move from 'Not Addressed' to target section.
+
+        Moves are applied together by ``save`` so the buffer is edited
+        once per removed item and once per (section, PR) group.
+        """
+        if target_section not in self._anchors:
+            print(f"⚠️  Could not find section: {self.SECTIONS[target_section]}")
             return
 
-        # Build new item text
-        emoji_map = {
-            "IMPLEMENT": "✅",
-            "DEFER": "⚠️",
-            "REJECT": "❌",
-            "ALREADY_IMPLEMENTED": "✅",
-        }
-
-        new_item = [
-            f"\n### PR #{item['pr']}",
-            f"{item['number']}. {emoji_map.get(target_section.upper(), '•')} {item['body']}",
+        self._pending.append((item, target_section, decision_text))
+        self._dirty = True
+
+    def _format_item(self, item: dict, target_section: str, decision_text: str) -> list[str]:
+        """Build the lines for a dispositioned item."""
+        emoji = self.DISPOSITION_EMOJI.get(target_section.upper(), "•")
+        lines = [
+            f"{item['number']}. {emoji} {item['body']}",
         ]
 
         # Add decision text
         for line in decision_text.split("\n"):
-            new_item.append(f"   {line}")
+            lines.append(f"   {line}")
 
         # Add original details
         for detail in item["details"]:
-            new_item.append(f"   {detail}")
+            lines.append(f"   {detail}")
+
+        lines.append("")
+        return lines
+
+    def _flush_pending(self) -> None:
+        """Apply all queued moves to the buffer."""
+        # Remove from current locations, last first so earlier spans stay valid
+        for item, _, _ in sorted(self._pending, key=lambda p: p[0]["start"], reverse=True):
+            self._splice(item["start"], item["end"], b"")
+            self._items.remove(item)
+
+        # Group new entries by target section and PR, keeping review order
+        groups: dict[tuple[str, int], list[str]] = {}
+        for item, target_section, decision_text in self._pending:
+            entry = self._format_item(item, target_section, decision_text)
+            groups.setdefault((target_section, item["pr"]), []).extend(entry)
+        self._pending = []
+
+        for (target_section, pr), new_lines in groups.items():
+            anchor = self._anchors[target_section]
+
+            # Insert after existing PR items, or create a new PR block at the top
+            existing_pr = anchor["pr"] == pr
+            insertion_offset = anchor["end"] if existing_pr else anchor["start"]
+            if insertion_offset is None:
+                insertion_offset = len(self.buf)
+            if not existing_pr:
+                new_lines = [f"\n### PR #{pr}"] + new_lines
+
+            data = ("\n".join(new_lines) + "\n").encode("utf-8")
+            if insertion_offset == len(self.buf) and not self.buf.endswith(b"\n"):
+                data = b"\n" + data
+            self._splice(insertion_offset, insertion_offset, data)
+
+            if not existing_pr:
+                # The new block is now the section's leading PR block
+                anchor["pr"] = pr
+                anchor["start"] = insertion_offset + data.index(b"### PR")
+                anchor["end"] = insertion_offset + len(data)
 
-        new_item.append("")
+    def save(self) -> None:
+        """Save changes to file (atomically, and only if something changed)."""
+        if not self._dirty:
+            return
 
-        # Insert
-        self.lines[insertion_idx:insertion_idx] = new_item
+        self._flush_pending()
 
-    def save(self) -> None:
-        """Save changes to file."""
         # Update last review date
-        for i, line in enumerate(self.lines):
-            if line.startswith("**Last Review:**"):
-                self.lines[i] = f"**Last Review:** {datetime.now().strftime('%Y-%m-%d')}"
-                break
-
-        self.recommendations_file.write_text("\n".join(self.lines))
+        last_review = self.LAST_REVIEW_RE.search(self.buf)
+        if last_review is not None:
+            today = datetime.now().strftime('%Y-%m-%d')
+            self.buf[last_review.start():last_review.end()] = f"**Last Review:** {today}".encode()
+
+        # Write to a sibling temp file, then rename over the original
+        temp_file = self.recommendations_file.with_name(self.recommendations_file.name + ".tmp")
+        with open(temp_file, "wb") as f:
+            f.write(self.buf)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_file, self.recommendations_file)
+        self._dirty = False
 
     def review_items(self, pr_filter: Optional[int] = None) -> None:
         """Interactive review of all 'Not Addressed' items."""
@@ -267,16 +342,10 @@ class RecommendationDispositioner:
                     continue
 
                 # Move to appropriate section
-                section_map = {
-                    "IMPLEMENT": "approved",
-                    "DEFER": "deferred",
-                    "REJECT": "rejected",
-                    "ALREADY_IMPLEMENTED": "already_implemented",
-                }
-
-                self.move_item_to_section(item, section_map[disposition], decision_text)
+                target_section = self.DISPOSITION_SECTIONS[disposition]
+                self.move_item_to_section(item, target_section, decision_text)
                 dispositioned_count += 1
-                print(f"✅ Moved to '{section_map[disposition]}' section")
+                print(f"✅ Moved to '{target_section}' section")
 
         print(f"\n{'='*80}")
         print(f"📊 Review Complete!")
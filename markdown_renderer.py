@@ -5,13 +5,22 @@ This module provides functions to convert Markdown content to HTML
 and extract document titles from Markdown headings.
 """
 
+from collections import OrderedDict
 from markdown_it import MarkdownIt
+import hashlib
 import re
 
 # Module-level MarkdownIt instance for better performance
 # Enable GFM extensions: tables and strikethrough
 _markdown_parser = MarkdownIt('commonmark').enable(['table', 'strikethrough'])
 
+# Rendered HTML keyed by a digest of the markdown source (LRU, bounded)
+_RENDER_CACHE_SIZE = 256
+_render_cache: "OrderedDict[bytes, str]" = OrderedDict()
+
+# Level-1 heading "# Title", matched at a known line start
+_H1_RE = re.compile(r'#[ \t]+(.+?)[ \t]*$', re.MULTILINE)
+
 
 def render_markdown(md_content: str) -> str:
     """
@@ -19,7 +28,8 @@ def render_markdown(md_content: str) -> str:
 
     Converts Markdown text to HTML using the markdown-it-py library.
     Supports standard Markdown features including headings, lists,
-    code blocks, emphasis, links, and more.
+    code blocks, emphasis, links, and more. Output for recently seen
+    content is served from a small in-memory cache.
 
     Args:
         md_content: Markdown text to render
@@ -37,7 +47,17 @@ def render_markdown(md_content: str) -> str:
     if not md_content:
         return ""
 
-    return _markdown_parser.render(md_content)
+    key = hashlib.blake2b(md_content.encode('utf-8'), digest_size=16).digest()
+    html = _render_cache.get(key)
+    if html is not None:
+        _render_cache.move_to_end(key)
+        return html
+
+    html = _markdown_parser.render(md_content)
+    _render_cache[key] = html
+    if len(_render_cache) > _RENDER_CACHE_SIZE:
+        _render_cache.popitem(last=False)
+    return html
 
 
 def extract_title(md_content: str) -> str:
@@ -68,11 +88,21 @@ def extract_title(md_content: str) -> str:
     if not md_content:
         return "Untitled Document"
 
-    # Look for first H1 heading (# Title pattern at start of line)
-    # Match format: # Title (with optional leading/trailing whitespace)
-    match = re.search(r'^#\s+(.+?)$', md_content, re.MULTILINE)
-
-    if match:
-        return match.group(1).strip()
+    # Fast path: the document opens with its title
+    if md_content.startswith(('# ', '#\t')):
+        line_end = md_content.find('\n')
+        title = md_content[2:line_end if line_end != -1 else None].strip()
+        if title:
+            return title
+
+    # Look for first H1 heading (# Title pattern at start of line). Only
+    # lines starting with '#' are tried, found with str.find rather than
+    # by the regex engine attempting a match at every line start
+    pos = 0 if md_content.startswith('#') else md_content.find('\n#')
+    while pos != -1:
+        match = _H1_RE.match(md_content, pos + (md_content[pos] == '\n'))
+        if match:
+            return match.group(1).strip()
+        pos = md_content.find('\n#', pos + 1)
 
     return "Untitled Document"
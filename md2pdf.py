@@ -7,17 +7,37 @@ math equations, and syntax highlighting to PDF or HTML.
 """
 
 import click
-import glob
+import hashlib
+import json
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, Collection, Dict, List, Optional, Tuple
 from config_loader import load_config
+from file_finder import IGNORED_DIRS, glob_files, ignore_dirs_from_config, read_markdown
 from theme_manager import list_themes
-from document_builder import build_html_document
-from renderer_client import RendererClient
+from document_builder import (
+    TEMPLATE_PATH, ThemeContext, prepare_theme_context, render_document
+)
+from renderer_client import RendererClient, MAX_CONCURRENT_RENDERS
+
+# File suffixes treated as markdown input
+MARKDOWN_SUFFIXES = frozenset({'.md', '.markdown'})
+
+# Answers accepted by prompt_output_format
+FORMAT_CHOICES = {'1': 'pdf', '2': 'html'}
+
+# Per-user record of what each output was built from, keyed by absolute source path
+CONVERSION_CACHE_FILE = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "md2pdf" / "conversions.json"
+)
 
 @click.command()
 @click.option('--config', type=click.Path(exists=True), help='Path to config file')
-def cli(config: Optional[str]):
+@click.option('--force', is_flag=True, help='Reconvert files even if outputs are up to date')
+def cli(config: Optional[str], force: bool):
     """Interactive Markdown to PDF/HTML converter"""
     click.echo("=== md2pdf: Markdown to PDF/HTML Converter ===\n")
 
@@ -25,7 +45,7 @@ def cli(config: Optional[str]):
     cfg = load_config(Path(config) if config else None)
 
     # Interactive prompt flow
-    files = prompt_file_selection()
+    files = prompt_file_selection(ignore_dirs_from_config(cfg))
     if not files:
         click.echo("No files selected. Exiting.")
         return
@@ -40,43 +60,16 @@ def cli(config: Optional[str]):
         filename = None  # Batch mode uses defaults
 
     # Process conversion
-    process_conversion(files, output_format, theme, filename, cfg)
+    process_conversion(files, output_format, theme, filename, cfg, force=force)
 
     click.echo("\n✓ Conversion complete!")
 
-def glob_files(pattern: str) -> List[Path]:
+def prompt_file_selection(ignore_dirs: Collection[str] = IGNORED_DIRS) -> List[Path]:
     """
-    Find files matching glob pattern.
+    Prompt user for file selection (single or batch).
 
     Args:
-        pattern: Glob pattern (e.g., "*.md", "docs/**/*.md")
-
-    Returns:
-        List of matching file paths
-
-    Examples:
-        >>> glob_files("*.md")
-        [Path("readme.md"), Path("notes.md")]
-
-        >>> glob_files("docs/**/*.md")  # Recursive
-        [Path("docs/guide.md"), Path("docs/api/reference.md")]
-    """
-    # Check if it's a direct file path first
-    direct_path = Path(pattern)
-    if direct_path.is_file():
-        return [direct_path]
-
-    # Use glob to find matching files
-    matches = glob.glob(pattern, recursive=True)
-
-    # Convert to Path objects and filter for files only
-    files = [Path(m) for m in matches if Path(m).is_file()]
-
-    return sorted(files)
-
-def prompt_file_selection() -> List[Path]:
-    """
-    Prompt user for file selection (single or batch).
+        ignore_dirs: Directory names recursive patterns never enter
 
     Returns:
         List of selected file paths
@@ -90,6 +83,9 @@ def prompt_file_selection() -> List[Path]:
     click.echo("\n📄 File Selection")
     click.echo("Enter a file path or glob pattern (e.g., *.md, docs/**/*.md)")
 
+    # Directory listings shared by retries, refreshed when a directory changes
+    listings = {}
+
     while True:
         pattern = click.prompt("Files", type=str)
 
@@ -97,23 +93,16 @@ def prompt_file_selection() -> List[Path]:
         direct_path = Path(pattern)
         if direct_path.is_file():
             # Single file
-            if direct_path.suffix.lower() not in ['.md', '.markdown']:
+            if direct_path.suffix.lower() not in MARKDOWN_SUFFIXES:
                 click.echo(f"⚠️  Warning: {direct_path.name} is not a markdown file", err=True)
                 if not click.confirm("Continue anyway?"):
                     continue
             return [direct_path]
 
-        # Try as glob pattern
-        files = glob_files(pattern)
-
-        if not files:
-            click.echo(f"❌ No files found matching: {pattern}", err=True)
-            if not click.confirm("Try again?", default=True):
-                return []
-            continue
-
-        # Filter for markdown files
-        md_files = [f for f in files if f.suffix.lower() in ['.md', '.markdown']]
+        # Try as glob pattern, keeping only markdown files
+        md_files = glob_files(
+            pattern, extensions=MARKDOWN_SUFFIXES, ignore_dirs=ignore_dirs, listings=listings
+        )
 
         if not md_files:
             click.echo(f"❌ No markdown files found matching: {pattern}", err=True)
@@ -131,12 +120,34 @@ def prompt_file_selection() -> List[Path]:
         if click.confirm("Proceed with these files?", default=True):
             return md_files
 
-def prompt_output_format(config: dict) -> str:
+@lru_cache(maxsize=8)
+def _theme_menu(themes: Tuple[str, ...], default_theme: str) -> Tuple[str, str]:
+    """
+    Build the theme selection menu once per theme list and default.
+
+    Returns:
+        Menu text and default choice number
+    """
+    menu = "\n".join(
+        f"{idx}. {theme}{' (default)' if theme == default_theme else ''}"
+        for idx, theme in enumerate(themes, 1)
+    )
+
+    # Find default theme number
+    try:
+        default_num = str(themes.index(default_theme) + 1)
+    except ValueError:
+        default_num = '1'
+
+    return menu, default_num
+
+def prompt_output_format(config: dict, *, read: Optional[Callable[[str], str]] = None) -> str:
     """
     Prompt user for output format (PDF or HTML).
 
     Args:
         config: Configuration dictionary
+        read: Reads one answer given a prompt (default: input)
 
     Returns:
         Selected format: 'pdf' or 'html'
@@ -147,27 +158,26 @@ def prompt_output_format(config: dict) -> str:
 
     default_format = config['output']['format']
     default_num = '1' if default_format == 'pdf' else '2'
+    read = read or input
 
     while True:
-        choice = input(f"Select format [1-2] (default: {default_num}): ").strip()
+        choice = read(f"Select format [1-2] (default: {default_num}): ").strip()
 
         # Use default if empty
         if not choice:
             choice = default_num
 
-        if choice == '1':
-            return 'pdf'
-        elif choice == '2':
-            return 'html'
-        else:
-            click.echo("❌ Invalid choice. Please enter 1 or 2.", err=True)
+        if choice in FORMAT_CHOICES:
+            return FORMAT_CHOICES[choice]
+        click.echo("❌ Invalid choice. Please enter 1 or 2.", err=True)
 
-def prompt_theme_selection(config: dict) -> str:
+def prompt_theme_selection(config: dict, *, read: Optional[Callable[[str], str]] = None) -> str:
     """
     Prompt user for theme selection.
 
     Args:
         config: Configuration dictionary
+        read: Reads one answer given a prompt (default: input)
 
     Returns:
         Selected theme name
@@ -175,21 +185,14 @@ def prompt_theme_selection(config: dict) -> str:
     click.echo("\n🎨 Theme Selection")
 
     themes = list_themes()
-    default_theme = config['output']['default_theme']
+    menu, default_num = _theme_menu(themes, config['output']['default_theme'])
 
     # Display themes with numbers
-    for idx, theme in enumerate(themes, 1):
-        default_marker = " (default)" if theme == default_theme else ""
-        click.echo(f"{idx}. {theme}{default_marker}")
-
-    # Find default theme number
-    try:
-        default_num = str(themes.index(default_theme) + 1)
-    except ValueError:
-        default_num = '1'
+    click.echo(menu)
+    read = read or input
 
     while True:
-        choice = input(f"Select theme [1-{len(themes)}] (default: {default_num}): ").strip()
+        choice = read(f"Select theme [1-{len(themes)}] (default: {default_num}): ").strip()
 
         # Use default if empty
         if not choice:
@@ -204,13 +207,19 @@ def prompt_theme_selection(config: dict) -> str:
         except ValueError:
             click.echo(f"❌ Invalid choice. Please enter a number 1-{len(themes)}.", err=True)
 
-def prompt_filename(input_file: Path, output_format: str) -> str:
+def prompt_filename(
+    input_file: Path,
+    output_format: str,
+    *,
+    read: Optional[Callable[[str], str]] = None
+) -> str:
     """
     Prompt user for output filename (single file only).
 
     Args:
         input_file: Input file path
         output_format: Output format ('pdf' or 'html')
+        read: Reads one answer given a prompt (default: input)
 
     Returns:
         Output filename with correct extension
@@ -219,9 +228,10 @@ def prompt_filename(input_file: Path, output_format: str) -> str:
 
     click.echo("\n💾 Output Filename")
     click.echo(f"Default: {default_name}")
+    read = read or input
 
     while True:
-        filename = input(f"Output filename (default: {default_name}): ").strip()
+        filename = read(f"Output filename (default: {default_name}): ").strip()
 
         # Use default if empty
         if not filename:
@@ -238,71 +248,230 @@ def prompt_filename(input_file: Path, output_format: str) -> str:
 
         return filename
 
+def _convert_file(
+    md_file: Path,
+    output_path: Path,
+    context: ThemeContext,
+    output_format: str,
+    client: Optional[RendererClient] = None,
+    render_options: Optional[dict] = None
+) -> None:
+    """Build one file's HTML document and write its PDF (via client) or HTML output."""
+    step = "Converting to PDF" if output_format == 'pdf' else "Saving HTML"
+    click.echo(f"\n📄 Processing: {md_file.name}\n  ⚙️  {step}...")
+
+    html = render_document(read_markdown(md_file), context)
+    if output_format == 'pdf':
+        client.render_pdf_to_file(html, output_path, render_options)
+    else:
+        output_path.write_text(html, encoding='utf-8')
+
+def _file_digest(path: Path) -> str:
+    """Return a short BLAKE2b digest of a file's contents."""
+    return hashlib.blake2b(path.read_bytes(), digest_size=16).hexdigest()
+
+def load_conversion_cache() -> dict:
+    """Load the conversion cache, or an empty cache if unreadable."""
+    try:
+        return json.loads(CONVERSION_CACHE_FILE.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+
+def save_conversion_cache(cache: dict) -> None:
+    """Write the conversion cache."""
+    CONVERSION_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    CONVERSION_CACHE_FILE.write_text(json.dumps(cache, indent=2), encoding='utf-8')
+
+# Entry fields that must all match for an output to be reused
+_CACHE_SETTINGS = ('output', 'format', 'theme', 'theme_css', 'template', 'config')
+
+def _is_up_to_date(cached: Optional[dict], entry: dict, md_file: Path) -> bool:
+    """
+    Check whether an output can be reused.
+
+    Settings, theme CSS, template and output must match and the output
+    must still exist. The
+    source is compared by mtime and size first; its contents are hashed
+    only when those differ (e.g. a touched but unedited file).
+    """
+    if not cached or not Path(entry['output']).exists():
+        return False
+    if any(cached.get(k) != entry[k] for k in _CACHE_SETTINGS):
+        return False
+    if cached.get('mtime_ns') == entry['mtime_ns'] and cached.get('size') == entry['size']:
+        entry['digest'] = cached.get('digest')
+        return True
+    entry['digest'] = _file_digest(md_file)
+    return cached.get('digest') == entry['digest']
+
 def process_conversion(
     files: List[Path],
     output_format: str,
     theme: str,
     filename: Optional[str],
-    config: dict
+    config: dict,
+    force: bool = False
 ):
     """
     Process file conversion.
 
+    Files whose output is already up to date (same source, theme and its
+    CSS, template, format and config as recorded in the conversion cache)
+    are skipped.
+
     Args:
         files: List of markdown files to convert
         output_format: Output format ('pdf' or 'html')
         theme: Theme name
         filename: Output filename (for single file) or None (for batch)
         config: Configuration dictionary
+        force: Reconvert every file, ignoring the conversion cache
     """
-    for idx, md_file in enumerate(files):
-        click.echo(f"\n📄 Processing: {md_file.name}")
-
-        # Read markdown content
-        md_content = md_file.read_text(encoding='utf-8')
-
-        # Build HTML document
-        html = build_html_document(md_content, theme, config)
-
-        # Determine output filename
-        if filename and len(files) == 1:
-            # Single file with custom filename
-            output_name = filename
-        else:
-            # Batch mode or default: use input filename with new extension
-            output_name = f"{md_file.stem}.{output_format}"
-
-        output_path = Path(output_name)
-
-        # Convert based on format
-        if output_format == 'pdf':
-            click.echo(f"  ⚙️  Converting to PDF...")
-
-            # Prepare PDF options
-            pdf_opts = config.get('pdf_options', {})
-            render_options = {
-                'format': pdf_opts.get('page_size', 'letter'),
-                'printBackground': pdf_opts.get('print_background', True),
-                'margin': pdf_opts.get('margins', {
-                    'top': '1in',
-                    'bottom': '1in',
-                    'left': '1in',
-                    'right': '1in'
-                })
-            }
-
-            # Use renderer client
-            with RendererClient() as client:
-                pdf_bytes = client.render_pdf(html, render_options)
-
-            # Write PDF
-            output_path.write_bytes(pdf_bytes)
-
-        else:  # html
-            click.echo(f"  ⚙️  Saving HTML...")
-            output_path.write_text(html, encoding='utf-8')
-
-        click.echo(f"  ✅ Saved: {output_path}")
+    # Determine output filenames
+    if filename and len(files) == 1:
+        # Single file with custom filename
+        output_paths = [Path(filename)]
+    else:
+        # Batch mode or default: use input filename with new extension
+        output_paths = [Path(f"{md_file.stem}.{output_format}") for md_file in files]
+
+    # Files are converted concurrently, so no two may share an output
+    _check_unique_outputs(files, output_paths)
+
+    # Skip files whose output is up to date
+    config_digest = hashlib.blake2b(
+        json.dumps(config, sort_keys=True, default=str).encode('utf-8'), digest_size=16
+    ).hexdigest()
+    context = prepare_theme_context(theme, config)
+    theme_digest = hashlib.blake2b(
+        context.theme_css.encode('utf-8'), digest_size=16
+    ).hexdigest()
+    template_stamp = f"{TEMPLATE_PATH.resolve()}:{context.template_mtime_ns}"
+    cache = load_conversion_cache()
+    stale = []
+    for md_file, output_path in zip(files, output_paths):
+        st = md_file.stat()
+        key = str(md_file.resolve())
+        entry = {
+            'output': str(output_path.resolve()),
+            'format': output_format,
+            'theme': theme,
+            'theme_css': theme_digest,
+            'template': template_stamp,
+            'config': config_digest,
+            'mtime_ns': st.st_mtime_ns,
+            'size': st.st_size,
+        }
+        if not force and _is_up_to_date(cache.get(key), entry, md_file):
+            click.echo(f"\nℹ️  Up to date, skipping: {md_file.name}")
+            cache[key] = entry
+            continue
+        if entry.get('digest') is None:
+            entry['digest'] = _file_digest(md_file)
+        stale.append((md_file, output_path, key, entry))
+
+    if not stale:
+        save_conversion_cache(cache)
+        return
+
+    convert = partial(_convert_file, context=context, output_format=output_format)
+
+    # Each file is built, rendered and written in one task, so output
+    # starts landing while later files are still being built
+    if output_format == 'pdf':
+        # Prepare PDF options
+        pdf_opts = config.get('pdf_options', {})
+        render_options = {
+            'format': pdf_opts.get('page_size', 'letter'),
+            'printBackground': pdf_opts.get('print_background', True),
+            'margin': pdf_opts.get('margins', {
+                'top': '1in',
+                'bottom': '1in',
+                'left': '1in',
+                'right': '1in'
+            })
+        }
+
+        # One renderer server for the whole batch; keep up to its
+        # concurrency limit of files in flight
+        with RendererClient() as client:
+            convert = partial(convert, client=client, render_options=render_options)
+            workers = min(MAX_CONCURRENT_RENDERS, len(stale))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                _run_conversions(pool, convert, stale, cache)
+    elif len(stale) < 2:
+        # A single file is built in-process to avoid pool start-up cost
+        _run_conversions(None, convert, stale, cache)
+    else:
+        # Markdown and template rendering are CPU-bound; spread HTML
+        # batches across worker processes
+        workers = min(len(stale), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            _run_conversions(pool, convert, stale, cache)
+
+def _check_unique_outputs(files: List[Path], output_paths: List[Path]) -> None:
+    """
+    Reject batches where several inputs would write the same output file.
+
+    Raises:
+        click.ClickException: Naming the inputs that collide
+    """
+    sources: Dict[str, List[Path]] = {}
+    for md_file, output_path in zip(files, output_paths):
+        sources.setdefault(os.path.normcase(str(output_path.resolve())), []).append(md_file)
+
+    clashes = [
+        f"{output} <- {', '.join(str(f) for f in inputs)}"
+        for output, inputs in sources.items() if len(inputs) > 1
+    ]
+    if clashes:
+        raise click.ClickException(
+            "Several files would be written to the same output:\n  " + "\n  ".join(clashes)
+        )
+
+def _run_conversions(
+    pool: Optional[Executor],
+    convert: Callable[[Path, Path], None],
+    stale: List[Tuple[Path, Path, str, dict]],
+    cache: dict
+) -> None:
+    """
+    Convert stale files, recording each cache entry as its output lands.
+
+    Runs in-process when pool is None. After a failure, files not yet
+    started are cancelled and the ones already running finish; the cache
+    is saved with every completed output before the error is re-raised.
+    """
+    error = None
+    try:
+        if pool is None:
+            for md_file, output_path, key, entry in stale:
+                convert(md_file, output_path)
+                click.echo(f"  ✅ Saved: {output_path}")
+                cache[key] = entry
+            return
+
+        futures = {
+            pool.submit(convert, md_file, output_path): (output_path, key, entry)
+            for md_file, output_path, key, entry in stale
+        }
+        for future in as_completed(futures):
+            if future.cancelled():
+                continue
+            if future.exception() is not None:
+                if error is None:
+                    error = future.exception()
+                    for pending in futures:
+                        pending.cancel()
+                continue
+            output_path, key, entry = futures[future]
+            click.echo(f"  ✅ Saved: {output_path}")
+            cache[key] = entry
+    finally:
+        save_conversion_cache(cache)
+
+    if error is not None:
+        raise error
 
 def main():
     """Main entry point"""
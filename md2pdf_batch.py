@@ -12,12 +12,15 @@ import glob
 import json as json_module
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import Callable, Collection, List, Optional, Dict, Any
 
-from document_builder import build_html_document
-from renderer_client import RendererClient
+from document_builder import ThemeContext, prepare_theme_context, render_document
+from renderer_client import RendererClient, MAX_CONCURRENT_RENDERS
 from config_loader import load_config
+from file_finder import IGNORED_DIRS, glob_files, ignore_dirs_from_config, read_markdown
 from theme_manager import list_themes
 
 
@@ -63,12 +66,16 @@ def save_skill_config(config: Dict[str, Any]) -> None:
     )
 
 
-def resolve_files(patterns: List[str]) -> List[Path]:
+def resolve_files(
+    patterns: List[str],
+    ignore_dirs: Collection[str] = IGNORED_DIRS
+) -> List[Path]:
     """
     Resolve file patterns to actual file paths.
 
     Args:
         patterns: List of file paths or glob patterns
+        ignore_dirs: Directory names recursive patterns never enter
 
     Returns:
         List of resolved Path objects
@@ -79,16 +86,8 @@ def resolve_files(patterns: List[str]) -> List[Path]:
     resolved = []
 
     for pattern in patterns:
-        path = Path(pattern)
-
-        # Direct file path
-        if path.is_file():
-            resolved.append(path)
-            continue
-
-        # Glob pattern
-        matches = glob.glob(pattern, recursive=True)
-        files = [Path(m) for m in matches if Path(m).is_file()]
+        # Direct file path or glob pattern
+        files = glob_files(pattern, ignore_dirs=ignore_dirs)
 
         if not files:
             raise FileNotFoundError(f"No files found matching: {pattern}")
@@ -98,6 +97,10 @@ def resolve_files(patterns: List[str]) -> List[Path]:
     if not resolved:
         raise FileNotFoundError("No files found")
 
+    # A single literal path has nothing to merge, dedupe or sort
+    if len(patterns) == 1 and not glob.has_magic(patterns[0]):
+        return resolved
+
     return sorted(set(resolved))
 
 
@@ -115,11 +118,21 @@ def validate_theme(theme: str) -> None:
         )
 
 
+def output_path_for(input_file: Path, format: str, output_dir: Optional[Path] = None) -> Path:
+    """Get the output path for an input file (next to it unless output_dir is given)."""
+    if output_dir:
+        return output_dir / f"{input_file.stem}.{format}"
+    return input_file.parent / f"{input_file.stem}.{format}"
+
+
 def convert_file(
     input_file: Path,
     format: str,
     theme: str,
-    output_dir: Optional[Path] = None
+    output_dir: Optional[Path] = None,
+    client: Optional[RendererClient] = None,
+    config: Optional[Dict[str, Any]] = None,
+    context: Optional[ThemeContext] = None
 ) -> Dict[str, Any]:
     """
     Convert a single markdown file.
@@ -129,25 +142,27 @@ def convert_file(
         format: Output format ('pdf' or 'html')
         theme: Theme name
         output_dir: Custom output directory (None = same as input)
+        client: Running renderer for PDF output (None = start one for this file)
+        config: Loaded configuration (None = load the default config)
+        context: Theme context prepared for the batch (None = prepare for this file)
 
     Returns:
         Dict with success, input, output, error keys
     """
     try:
-        # Determine output path
-        if output_dir:
-            output_path = output_dir / f"{input_file.stem}.{format}"
-        else:
-            output_path = input_file.parent / f"{input_file.stem}.{format}"
+        output_path = output_path_for(input_file, format, output_dir)
 
         # Read markdown
-        md_content = input_file.read_text(encoding="utf-8")
+        md_content = read_markdown(input_file)
 
-        # Load config
-        config = load_config()
+        # Load config unless the caller already has it
+        if config is None:
+            config = load_config()
 
         # Build HTML
-        html = build_html_document(md_content, theme, config)
+        if context is None:
+            context = prepare_theme_context(theme, config)
+        html = render_document(md_content, context)
 
         # Convert based on format
         if format == "pdf":
@@ -161,10 +176,12 @@ def convert_file(
                 })
             }
 
-            with RendererClient() as client:
-                pdf_bytes = client.render_pdf(html, render_options)
-
-            output_path.write_bytes(pdf_bytes)
+            # Stream the PDF to disk rather than holding it in memory
+            if client is not None:
+                client.render_pdf_to_file(html, output_path, render_options)
+            else:
+                with RendererClient() as own_client:
+                    own_client.render_pdf_to_file(html, output_path, render_options)
         else:
             output_path.write_text(html, encoding="utf-8")
 
@@ -188,25 +205,104 @@ def process_batch(
     files: List[Path],
     format: str,
     theme: str,
-    output_dir: Optional[Path] = None
+    output_dir: Optional[Path] = None,
+    jobs: Optional[int] = None,
+    config: Optional[Dict[str, Any]] = None
 ) -> List[Dict[str, Any]]:
     """
-    Process multiple files sequentially.
+    Process multiple files.
+
+    HTML batches are converted across worker processes. PDF batches share
+    a single renderer server, with up to its concurrency limit of files
+    converting at once. Files that would write the same output (same stem
+    into one output directory) fail without being converted.
 
     Args:
         files: List of markdown files
         format: Output format
         theme: Theme name
         output_dir: Custom output directory
+        jobs: Maximum concurrent conversions (None = CPU count for HTML and
+            the renderer's limit for PDF, 1 = in-process, one at a time)
+        config: Loaded configuration (None = load the default config once)
 
     Returns:
-        List of result dicts from convert_file
+        List of result dicts from convert_file, in input order
     """
-    results = []
+    if config is None:
+        config = load_config()
+
+    # Resolve the theme once for every file
+    try:
+        context = prepare_theme_context(theme, config)
+    except Exception as e:
+        return _failed_results(files, e)
+
+    convert = partial(
+        convert_file, format=format, theme=theme, output_dir=output_dir,
+        config=config, context=context
+    )
+
+    # Files convert concurrently, so any sharing an output are failed
+    # up front rather than left to race on one file
+    outputs: Dict[Path, List[Path]] = {}
     for f in files:
-        result = convert_file(f, format, theme, output_dir)
-        results.append(result)
-    return results
+        outputs.setdefault(output_path_for(f, format, output_dir).resolve(), []).append(f)
+    clashes = {
+        f: ValueError(f"Output {output} would also be written by another input file")
+        for output, inputs in outputs.items() if len(inputs) > 1 for f in inputs
+    }
+    pending = [f for f in files if f not in clashes]
+
+    converted = iter(_convert_all(convert, pending, format, jobs))
+    return [
+        _failed_results([f], clashes[f])[0] if f in clashes else next(converted)
+        for f in files
+    ]
+
+
+def _convert_all(
+    convert: Callable[..., Dict[str, Any]],
+    files: List[Path],
+    format: str,
+    jobs: Optional[int]
+) -> List[Dict[str, Any]]:
+    """Run convert over files, concurrently unless jobs is 1, in input order."""
+    if not files:
+        return []
+
+    if format == "pdf":
+        client = RendererClient()
+        try:
+            client.start_server()
+        except Exception as e:
+            return _failed_results(files, e)
+        try:
+            convert = partial(convert, client=client)
+            if jobs == 1:
+                return [convert(f) for f in files]
+
+            # Keep up to the server's concurrency limit of files in flight
+            workers = min(jobs or MAX_CONCURRENT_RENDERS, MAX_CONCURRENT_RENDERS, len(files))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                return list(pool.map(convert, files))
+        finally:
+            client.stop_server()
+
+    if len(files) < 2 or jobs == 1:
+        return [convert(f) for f in files]
+
+    workers = min(jobs or os.cpu_count() or 1, len(files))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(convert, files))
+
+
+def _failed_results(files: List[Path], error: Exception) -> List[Dict[str, Any]]:
+    """Report a batch-wide failure against every file, as convert_file would."""
+    return [
+        {"success": False, "input": f, "output": None, "error": str(error)}
+        for f in files
+    ]
 
 
 def parse_args(args=None):
@@ -250,6 +346,14 @@ def parse_args(args=None):
         help="Custom output directory (required if --output-mode is custom)"
     )
 
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Maximum parallel conversions; 1 converts one file at a time "
+             f"(default: CPU count for HTML, {MAX_CONCURRENT_RENDERS} for PDF)"
+    )
+
     parser.add_argument(
         "--json-output",
         action="store_true",
@@ -268,12 +372,19 @@ def main(args=None):
         print("Error: --output-dir is required when --output-mode=custom")
         return 1
 
+    if parsed.jobs is not None and parsed.jobs < 1:
+        print("Error: --jobs must be at least 1")
+        return 1
+
     try:
         # Validate theme first
         validate_theme(parsed.theme)
 
+        # Load config once for the whole batch
+        config = load_config()
+
         # Resolve files
-        files = resolve_files(parsed.files)
+        files = resolve_files(parsed.files, ignore_dirs_from_config(config))
 
         # Determine output directory
         output_dir = parsed.output_dir if parsed.output_mode == "custom" else None
@@ -283,7 +394,9 @@ def main(args=None):
             files=files,
             format=parsed.format,
             theme=parsed.theme,
-            output_dir=output_dir
+            output_dir=output_dir,
+            jobs=parsed.jobs,
+            config=config
         )
 
         # Calculate summary
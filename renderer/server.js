@@ -21,6 +21,33 @@ if (isWindows) {
 const MAX_CONCURRENT_RENDERS = 3;
 let activeRenders = 0;
 
+// Shared browser, launched on first render and reused across requests
+let browserPromise = null;
+
+function getBrowser() {
+    if (!browserPromise) {
+        browserPromise = puppeteer.launch({
+            headless: 'new',
+            args: (isDocker || isWindows) ? [
+                '--no-sandbox',
+                '--disable-setuid-sandbox',
+                '--disable-dev-shm-usage',
+                '--disable-gpu'
+            ] : []
+        }).then(browser => {
+            // Relaunch on next request if the browser goes away
+            browser.on('disconnected', () => {
+                browserPromise = null;
+            });
+            return browser;
+        }).catch(error => {
+            browserPromise = null;
+            throw error;
+        });
+    }
+    return browserPromise;
+}
+
 // Middleware
 app.use(bodyParser.json({ limit: '50mb' }));
 app.use(bodyParser.urlencoded({ extended: true, limit: '50mb' }));
@@ -43,16 +70,19 @@ app.use((req, res, next) => {
     next();
 });
 
-// Concurrency limiting middleware for render endpoints
-app.use('/render/*', (req, res, next) => {
+// Concurrency limit for render endpoints. Checked inside each handler,
+// once the body has been parsed, so that a slow upload cannot let extra
+// requests past the check before the render count goes up
+function rejectIfBusy(res) {
     if (activeRenders >= MAX_CONCURRENT_RENDERS) {
-        return res.status(503).json({
+        res.status(503).json({
             error: 'Service busy',
             message: `Too many concurrent requests (${activeRenders}/${MAX_CONCURRENT_RENDERS}). Please retry later.`
         });
+        return true;
     }
-    next();
-});
+    return false;
+}
 
 // Health check endpoint
 app.get('/health', (req, res) => {
@@ -76,9 +106,25 @@ app.get('/', (req, res) => {
     });
 });
 
-// PDF rendering endpoint
-app.post('/render/pdf', async (req, res) => {
-    const { html, options = {} } = req.body;
+// PDF rendering endpoint. Accepts either raw HTML (text/html) with JSON
+// options in X-PDF-Options, or a JSON body of { html, options }
+app.post('/render/pdf', bodyParser.text({ type: 'text/html', limit: '50mb' }), async (req, res) => {
+    let html;
+    let options = {};
+
+    if (req.is('text/html')) {
+        html = req.body;
+        try {
+            options = JSON.parse(req.get('X-PDF-Options') || '{}');
+        } catch (error) {
+            return res.status(400).json({
+                error: 'Invalid X-PDF-Options header',
+                message: error.message
+            });
+        }
+    } else {
+        ({ html, options = {} } = req.body);
+    }
 
     if (!html) {
         return res.status(400).json({
@@ -86,22 +132,16 @@ app.post('/render/pdf', async (req, res) => {
         });
     }
 
+    if (rejectIfBusy(res)) {
+        return;
+    }
     activeRenders++;
-    let browser = null;
+    let page = null;
 
     try {
-        // Launch Puppeteer
-        browser = await puppeteer.launch({
-            headless: 'new',
-            args: (isDocker || isWindows) ? [
-                '--no-sandbox',
-                '--disable-setuid-sandbox',
-                '--disable-dev-shm-usage',
-                '--disable-gpu'
-            ] : []
-        });
-
-        const page = await browser.newPage();
+        // Each render gets its own page in the shared browser
+        const browser = await getBrowser();
+        page = await browser.newPage();
 
         // Set HTML content
         await page.setContent(html, {
@@ -143,12 +183,12 @@ app.post('/render/pdf', async (req, res) => {
         }
     } finally {
         activeRenders--;
-        // Always cleanup browser resources
-        if (browser) {
+        // Always cleanup page resources
+        if (page) {
             try {
-                await browser.close();
+                await page.close();
             } catch (closeError) {
-                console.error('Browser cleanup error:', closeError);
+                console.error('Page cleanup error:', closeError);
             }
         }
     }
@@ -164,6 +204,10 @@ app.post('/render/html', async (req, res) => {
         });
     }
 
+    if (rejectIfBusy(res)) {
+        return;
+    }
+
     try {
         // For HTML output, just return the HTML
         // Python client will save it to file
@@ -4,13 +4,23 @@ HTTP client for md2pdf renderer service.
 Manages Node.js server lifecycle and sends rendering requests.
 """
 
+import json
 import os
+import socket
 import subprocess
 import time
+import uuid
 import requests
 from pathlib import Path
+from requests.adapters import HTTPAdapter
 from typing import Optional, Dict, Any
 
+# Matches MAX_CONCURRENT_RENDERS in renderer/server.js
+MAX_CONCURRENT_RENDERS = 3
+
+# Bytes read per chunk when streaming a PDF response to disk
+STREAM_CHUNK_SIZE = 64 * 1024
+
 class RendererServerError(Exception):
     """Raised when renderer server fails"""
     pass
@@ -49,14 +59,24 @@ class RendererClient:
         self.timeout = timeout
         self.server_process = None
         self.base_url = f"http://localhost:{port}"
-
-    def start_server(self, max_retries: int = 10, retry_delay: float = 0.5):
+        self._session: Optional[requests.Session] = None
+
+    def _get_session(self) -> requests.Session:
+        """Return the keep-alive HTTP session, creating it on first use."""
+        if self._session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=MAX_CONCURRENT_RENDERS)
+            session.mount("http://", adapter)
+            self._session = session
+        return self._session
+
+    def start_server(self, max_retries: int = 100, retry_delay: float = 0.05):
         """
         Start Node.js renderer server.
 
         Args:
-            max_retries: Maximum health check retries (default: 10)
-            retry_delay: Delay between retries in seconds (default: 0.5)
+            max_retries: Maximum port probe retries (default: 100)
+            retry_delay: Delay between retries in seconds (default: 0.05)
 
         Raises:
             RendererServerError: If server fails to start
@@ -73,22 +93,26 @@ class RendererClient:
         env = os.environ.copy()
         env['PORT'] = str(self.port)
 
-        # Start Node.js process
+        # Start Node.js process; its output is never read, so discard it
+        # rather than let a full pipe buffer block the server
         self.server_process = subprocess.Popen(
             ['node', str(server_path)],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             env=env
         )
 
-        # Wait for server to be ready
+        # Wait for the port to accept connections, then confirm once over HTTP
         for i in range(max_retries):
-            try:
-                health = self.health_check()
-                if health.get('status') == 'healthy':
-                    return  # Server ready
-            except (requests.ConnectionError, requests.RequestException):
-                pass
+            if self._port_open():
+                try:
+                    if self.health_check().get('status') == 'healthy':
+                        return  # Server ready
+                except RendererServerError:
+                    pass
+                break
+            if self.server_process.poll() is not None:
+                break  # Server exited during startup
 
             time.sleep(retry_delay)
 
@@ -96,8 +120,20 @@ class RendererClient:
         self.stop_server()
         raise RendererServerError("Server failed to start after retries")
 
+    def _port_open(self) -> bool:
+        """Check whether the server port accepts TCP connections."""
+        try:
+            with socket.create_connection(('localhost', self.port), timeout=0.1):
+                return True
+        except OSError:
+            return False
+
     def stop_server(self):
         """Stop Node.js renderer server."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
         if self.server_process is not None:
             self.server_process.terminate()
             try:
@@ -131,7 +167,7 @@ class RendererClient:
             RendererServerError: If health check fails
         """
         try:
-            response = requests.get(
+            response = self._get_session().get(
                 f"{self.base_url}/health",
                 timeout=5
             )
@@ -155,17 +191,8 @@ class RendererClient:
             RendererServerError: If rendering fails
             RendererTimeoutError: If request times out
         """
-        payload = {
-            'html': html,
-            'options': options or {}
-        }
-
         try:
-            response = requests.post(
-                f"{self.base_url}/render/pdf",
-                json=payload,
-                timeout=self.timeout
-            )
+            response = self._post_pdf(html, options)
             response.raise_for_status()
             return response.content
         except requests.Timeout:
@@ -173,6 +200,72 @@ class RendererClient:
         except requests.RequestException as e:
             raise RendererServerError(f"PDF rendering failed: {e}")
 
+    def render_pdf_to_file(
+        self,
+        html: str,
+        output_path: Path,
+        options: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        Render HTML to PDF, streaming the response straight into a file.
+
+        Only STREAM_CHUNK_SIZE bytes of the PDF are held in memory at a
+        time. The PDF is streamed into a temporary file beside output_path
+        and moved over it once complete, so a failed render leaves any
+        existing output untouched.
+
+        Args:
+            html: HTML content to render
+            output_path: File to write the PDF to
+            options: PDF rendering options (optional)
+
+        Raises:
+            RendererServerError: If rendering fails
+            RendererTimeoutError: If request times out
+        """
+        try:
+            with self._post_pdf(html, options, stream=True) as response:
+                response.raise_for_status()
+                output_path = Path(output_path)
+                partial_path = output_path.with_name(
+                    f".{output_path.name}.{uuid.uuid4().hex[:8]}.part"
+                )
+                try:
+                    with open(partial_path, 'xb') as f:
+                        for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                            f.write(chunk)
+                    os.replace(partial_path, output_path)
+                except BaseException:
+                    try:
+                        os.unlink(partial_path)
+                    except FileNotFoundError:
+                        pass
+                    raise
+        except requests.Timeout:
+            raise RendererTimeoutError(f"PDF rendering timed out after {self.timeout}s")
+        except requests.RequestException as e:
+            raise RendererServerError(f"PDF rendering failed: {e}")
+
+    def _post_pdf(
+        self,
+        html: str,
+        options: Optional[Dict[str, Any]],
+        stream: bool = False
+    ) -> requests.Response:
+        """POST one document to /render/pdf."""
+        # Send the HTML as the raw request body, so it is encoded once
+        # rather than JSON-escaped; options travel in a header
+        return self._get_session().post(
+            f"{self.base_url}/render/pdf",
+            data=html.encode('utf-8'),
+            headers={
+                'Content-Type': 'text/html; charset=utf-8',
+                'X-PDF-Options': json.dumps(options or {})
+            },
+            timeout=self.timeout,
+            stream=stream
+        )
+
     def render_html(self, html: str) -> str:
         """
         Render HTML (passthrough).
@@ -189,7 +282,7 @@ class RendererClient:
         payload = {'html': html}
 
         try:
-            response = requests.post(
+            response = self._get_session().post(
                 f"{self.base_url}/render/html",
                 json=payload,
                 timeout=self.timeout
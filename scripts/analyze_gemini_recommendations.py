@@ -10,22 +10,211 @@ This script is meant to be run as part of an interactive Claude Code session
 where Claude will evaluate each recommendation and provide disposition advice.
 
 Usage:
-    python analyze_gemini_recommendations.py <pr_number>
+    python analyze_gemini_recommendations.py <pr_number> [--concurrency N]
     python analyze_gemini_recommendations.py 1
+    python analyze_gemini_recommendations.py 1 --concurrency 2
 """
 
+import argparse
+import hashlib
+import io
 import json
+import os
+import re
 import subprocess
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
+
+import requests
 
 # Repository configuration
 GITHUB_REPO = "Neikan-BSN/md2pdf"
+GITHUB_API_URL = "https://api.github.com"
+
+# One GraphQL round trip for everything main() needs; connections are capped
+# at 100 items, and anything longer falls back to the paginated REST calls
+PR_BUNDLE_QUERY = """
+query($owner: String!, $name: String!, $number: Int!) {
+  repository(owner: $owner, name: $name) {
+    pullRequest(number: $number) {
+      title
+      state
+      body
+      createdAt
+      changedFiles
+      comments(first: 100) {
+        pageInfo { hasNextPage }
+        nodes { author { __typename login } body }
+      }
+      reviews(first: 100) {
+        pageInfo { hasNextPage }
+        nodes {
+          author { __typename login }
+          body
+          comments(first: 100) {
+            pageInfo { hasNextPage }
+            nodes { author { __typename login } body path line }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+# Closing instructions appended to every analysis request
+ANALYSIS_REQUEST = """\
+## Analysis Request
+
+For each recommendation above, please provide:
+
+1. **Your Evaluation:**
+   - Technical validity of the recommendation
+   - Relevance to current phase/goals
+   - Alignment with project architecture decisions
+
+2. **Disposition Recommendation:**
+   - **IMPLEMENT** - Valid, should be implemented now or soon
+   - **DEFER** - Valid, but defer to future phase
+   - **REJECT** - YAGNI, over-engineering, or conflicts with design
+   - **ALREADY_IMPLEMENTED** - Feature/fix already exists
+
+3. **Rationale:** One-sentence reasoning for your recommendation
+
+4. **Scope** (if IMPLEMENT): Brief description of implementation work
+
+Format your response as structured recommendations that we can directly
+transfer to the decision record (.user/gemini-decisions/gemini-recommendations.md)."""
+
+# Bot accounts that post Gemini reviews
+GEMINI_LOGINS = frozenset({"gemini-code-assist[bot]", "google-github-actions[bot]"})
+
+# Severity markers in Gemini comments, and the badge images to strip
+SEVERITY_RE = re.compile(r"!\[(high|medium|low)\]|(high|medium|low)-priority", re.IGNORECASE)
+BADGE_RE = re.compile(
+    r"!\[(high|medium|low)\]\(https://www\.gstatic\.com/codereviewagent/\1-priority\.svg\)"
+)
+
+# Conditional-request cache for API responses: "<etag>\n<next page URL>\n<body>" per
+# (token, URL). Private to the user, and entries unused for a week are pruned
+GITHUB_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "md2pdf" / "gh"
+)
+GITHUB_CACHE_MAX_AGE = 7 * 24 * 60 * 60
+GITHUB_CACHE_MAX_ENTRIES = 1000
+
+
+@lru_cache(maxsize=None)
+def _github_session() -> requests.Session | None:
+    """
+    Create one keep-alive session for GitHub API calls.
+
+    The token is read from `gh auth token` once per run. Returns None when
+    gh has no token, so calls go through the gh CLI instead.
+    """
+    try:
+        token = subprocess.run(
+            ["gh", "auth", "token"],
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+    except FileNotFoundError:
+        return None
+
+    if not token:
+        return None
+
+    session = requests.Session()
+    session.headers.update({
+        "Authorization": f"Bearer {token}",
+        "Accept": "application/vnd.github+json",
+    })
+    return session
+
+
+@lru_cache(maxsize=None)
+def _github_cache_dir() -> Path:
+    """
+    Create the response cache directory (mode 0700) and prune it, once per run.
+
+    Entries not revalidated within GITHUB_CACHE_MAX_AGE are removed, then
+    the oldest beyond GITHUB_CACHE_MAX_ENTRIES.
+    """
+    GITHUB_CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+    GITHUB_CACHE_DIR.chmod(0o700)
+
+    entries = []
+    for entry in os.scandir(GITHUB_CACHE_DIR):
+        try:
+            entries.append((entry.stat().st_mtime, entry.path))
+        except OSError:
+            continue
+    entries.sort(reverse=True)
+
+    cutoff = time.time() - GITHUB_CACHE_MAX_AGE
+    for i, (mtime, path) in enumerate(entries):
+        if i >= GITHUB_CACHE_MAX_ENTRIES or mtime < cutoff:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+    return GITHUB_CACHE_DIR
+
+
+def cached_get(
+    session: requests.Session, url: str
+) -> tuple[dict[str, Any] | list[Any], str | None]:
+    """
+    GET a GitHub API URL, revalidating any cached copy by its ETag.
+
+    An unchanged resource comes back as 304 with no body and does not
+    count against the primary rate limit; the cached body is used instead.
+
+    Entries are keyed by the session's token as well as the URL, so one
+    account is never served a body fetched with another's credentials.
+
+    Returns the parsed body and the URL of the next page, if any.
+    """
+    key = f"{session.headers.get('Authorization', '')}\n{url}".encode()
+    cache_file = _github_cache_dir() / f"{hashlib.sha256(key).hexdigest()}.json"
+
+    headers = {}
+    try:
+        etag, cached_next, cached_body = cache_file.read_bytes().split(b"\n", 2)
+        headers["If-None-Match"] = etag.decode()
+    except (FileNotFoundError, ValueError):
+        cached_body = None
+
+    response = session.get(url, headers=headers, timeout=30)
+    if response.status_code == 304 and cached_body is not None:
+        cache_file.touch()  # Revalidated: keep it from expiring
+        return json.loads(cached_body), cached_next.decode() or None
+    response.raise_for_status()
+
+    next_url = response.links.get("next", {}).get("url")
+    etag = response.headers.get("ETag")
+    if etag:
+        cache_file.write_bytes(
+            etag.encode() + b"\n" + (next_url or "").encode() + b"\n" + response.content
+        )
+    return response.json(), next_url
 
 
 def run_gh_command(args: list[str]) -> dict[str, Any] | list[Any]:
-    """Run gh CLI command and return JSON output."""
+    """
+    Run gh CLI command and return JSON output.
+
+    `gh api <path>` calls are sent over the shared HTTP session instead of
+    starting a gh process (and a new TLS connection) for each one.
+    """
+    session = _github_session()
+    if session is not None and len(args) == 2 and args[0] == "api":
+        return cached_get(session, f"{GITHUB_API_URL}/{args[1]}")[0]
+
     result = subprocess.run(
         ["gh"] + args,
         capture_output=True,
@@ -35,6 +224,38 @@ def run_gh_command(args: list[str]) -> dict[str, Any] | list[Any]:
     return json.loads(result.stdout)
 
 
+def paginate(path: str) -> Iterator[dict[str, Any]]:
+    """
+    Yield every item of a paginated GitHub API list, 100 per page.
+
+    Pages are fetched lazily by following the Link rel="next" header, so
+    callers that stop early skip the remaining requests.
+    """
+    session = _github_session()
+    if session is None:
+        # gh prints each page as its own JSON array, back to back
+        result = subprocess.run(
+            ["gh", "api", "--paginate", f"{path}?per_page=100"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        decoder = json.JSONDecoder()
+        text = result.stdout.strip()
+        pos = 0
+        while pos < len(text):
+            page, pos = decoder.raw_decode(text, pos)
+            yield from page
+            while pos < len(text) and text[pos].isspace():
+                pos += 1
+        return
+
+    url = f"{GITHUB_API_URL}/{path}?per_page=100"
+    while url:
+        page, url = cached_get(session, url)
+        yield from page
+
+
 def fetch_pr_context(pr_number: int) -> dict[str, Any]:
     """Fetch PR metadata for context."""
     pr = run_gh_command([
@@ -53,15 +274,12 @@ def fetch_pr_context(pr_number: int) -> dict[str, Any]:
 
 def fetch_gemini_review_comments(pr_number: int) -> list[dict[str, Any]]:
     """Fetch Gemini code review comments from a PR."""
-    comments = run_gh_command([
-        "api",
-        f"repos/{GITHUB_REPO}/pulls/{pr_number}/comments",
-    ])
+    comments = paginate(f"repos/{GITHUB_REPO}/pulls/{pr_number}/comments")
 
     # Filter for Gemini bot comments only
     gemini_comments = [
         c for c in comments
-        if c["user"]["login"] == "gemini-code-assist[bot]"
+        if c["user"]["login"] in GEMINI_LOGINS
     ]
 
     return gemini_comments
@@ -69,13 +287,10 @@ def fetch_gemini_review_comments(pr_number: int) -> list[dict[str, Any]]:
 
 def fetch_gemini_review_summary(pr_number: int) -> str:
     """Fetch overall review comment from Gemini."""
-    reviews = run_gh_command([
-        "api",
-        f"repos/{GITHUB_REPO}/pulls/{pr_number}/reviews",
-    ])
+    reviews = paginate(f"repos/{GITHUB_REPO}/pulls/{pr_number}/reviews")
 
     for review in reviews:
-        if review["user"]["login"] == "gemini-code-assist[bot]":
+        if review["user"]["login"] in GEMINI_LOGINS:
             return review.get("body", "")
 
     return ""
@@ -90,47 +305,152 @@ def fetch_gemini_issue_comments(pr_number: int) -> list[dict[str, Any]]:
 
     Gemini reviews can be posted by:
     - gemini-code-assist[bot] (direct Gemini bot)
+    - google-github-actions[bot] (Google's GitHub Actions bot)
     - github-actions[bot] (Gemini Code Review GitHub Action)
     """
-    comments = run_gh_command([
-        "api",
-        f"repos/{GITHUB_REPO}/issues/{pr_number}/comments",
-    ])
+    comments = paginate(f"repos/{GITHUB_REPO}/issues/{pr_number}/comments")
 
     # Filter for Gemini-related comments
-    gemini_comments = []
-    for c in comments:
-        login = c["user"]["login"].lower()
-        body = c.get("body", "")
+    return [c for c in comments if is_gemini_issue_comment(c)]
 
-        # Check if it's from Gemini bot or GitHub Actions posting Gemini review
-        is_gemini_bot = "gemini" in login or "google" in login
-        is_gemini_action = "github-actions" in login and "Gemini Code Review" in body
 
-        if is_gemini_bot or is_gemini_action:
-            gemini_comments.append(c)
+def is_gemini_issue_comment(comment: dict[str, Any]) -> bool:
+    """Check if an issue comment is from Gemini bot or GitHub Actions posting Gemini review."""
+    login = comment["user"]["login"]
+    if login in GEMINI_LOGINS:
+        return True
+    return login == "github-actions[bot]" and "Gemini Code Review" in comment.get("body", "")
 
-    return gemini_comments
+
+def fetch_all(pr_number: int, concurrency: int = 4) -> tuple[
+    dict[str, Any], str, list[dict[str, Any]], list[dict[str, Any]]
+]:
+    """
+    Fetch PR context, review summary, issue comments and inline comments.
+
+    The four requests are independent, so up to `concurrency` of them run
+    at once.
+    """
+    # Set up the shared session before the worker threads use it
+    _github_session()
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        pr_context = pool.submit(fetch_pr_context, pr_number)
+        review_summary = pool.submit(fetch_gemini_review_summary, pr_number)
+        issue_comments = pool.submit(fetch_gemini_issue_comments, pr_number)
+        inline_comments = pool.submit(fetch_gemini_review_comments, pr_number)
+
+        return (
+            pr_context.result(),
+            review_summary.result(),
+            issue_comments.result(),
+            inline_comments.result(),
+        )
+
+
+def _graphql_login(actor: dict[str, Any] | None) -> str:
+    """Return an author's login as the REST API spells it."""
+    if actor is None:
+        return "ghost"  # Deleted account
+    if actor["__typename"] == "Bot":
+        return f"{actor['login']}[bot]"
+    return actor["login"]
+
+
+def fetch_gemini_bundle(pr_number: int) -> tuple[
+    dict[str, Any], str, list[dict[str, Any]], list[dict[str, Any]]
+] | None:
+    """
+    Fetch everything fetch_all does in a single GraphQL request.
+
+    Comments are returned in the REST shape the formatter expects.
+    Returns None when GraphQL is unavailable (no session, missing scope,
+    errors) or a list is longer than one page, so the caller can fall
+    back to the REST helpers.
+    """
+    session = _github_session()
+    if session is None:
+        return None
+
+    owner, name = GITHUB_REPO.split("/")
+    try:
+        response = session.post(
+            f"{GITHUB_API_URL}/graphql",
+            json={
+                "query": PR_BUNDLE_QUERY,
+                "variables": {"owner": owner, "name": name, "number": pr_number},
+            },
+            timeout=30,
+        )
+        response.raise_for_status()
+        data = response.json()
+    except requests.RequestException:
+        return None
+
+    if data.get("errors") or not data.get("data"):
+        return None
+    pr = data["data"]["repository"]["pullRequest"]
+    if pr is None:
+        return None
+
+    reviews = pr["reviews"]["nodes"]
+    connections = [pr["comments"], pr["reviews"]] + [r["comments"] for r in reviews]
+    if any(c["pageInfo"]["hasNextPage"] for c in connections):
+        return None
+
+    pr_context = {
+        "number": pr_number,
+        "title": pr["title"],
+        "state": "closed" if pr["state"] == "MERGED" else pr["state"].lower(),
+        "body": pr["body"][:500] if pr.get("body") else "",  # First 500 chars
+        "created_at": pr["createdAt"],
+        "files_changed": pr.get("changedFiles", 0),
+    }
+
+    review_summary = next(
+        (r["body"] for r in reviews if _graphql_login(r["author"]) in GEMINI_LOGINS),
+        "",
+    )
+
+    inline_comments = [
+        {"user": {"login": login}, "body": c["body"], "path": c["path"], "line": c["line"]}
+        for r in reviews
+        for c in r["comments"]["nodes"]
+        if (login := _graphql_login(c["author"])) in GEMINI_LOGINS
+    ]
+
+    issue_comments = [
+        c for c in (
+            {"user": {"login": _graphql_login(c["author"])}, "body": c["body"]}
+            for c in pr["comments"]["nodes"]
+        )
+        if is_gemini_issue_comment(c)
+    ]
+
+    return pr_context, review_summary, issue_comments, inline_comments
 
 
 def parse_severity(comment_body: str) -> str:
     """Extract severity level from comment body."""
-    body_lower = comment_body.lower()
-    if "![high]" in body_lower or "high-priority" in body_lower:
-        return "HIGH"
-    elif "![medium]" in body_lower or "medium-priority" in body_lower:
-        return "MEDIUM"
-    elif "![low]" in body_lower or "low-priority" in body_lower:
-        return "LOW"
+    found = {
+        (match.group(1) or match.group(2)).upper()
+        for match in SEVERITY_RE.finditer(comment_body)
+    }
+    # The most severe marker wins when a body mentions several
+    for severity in ("HIGH", "MEDIUM", "LOW"):
+        if severity in found:
+            return severity
     return "UNSPECIFIED"
 
 
 def clean_comment_body(body: str) -> str:
     """Remove markup and extract core recommendation text."""
     # Remove severity badges
-    body = body.replace("![high](https://www.gstatic.com/codereviewagent/high-priority.svg)", "")
-    body = body.replace("![medium](https://www.gstatic.com/codereviewagent/medium-priority.svg)", "")
-    body = body.replace("![low](https://www.gstatic.com/codereviewagent/low-priority.svg)", "")
+    body = BADGE_RE.sub("", body)
+
+    # Without a suggestion block the whole body is the recommendation
+    if "```suggestion" not in body:
+        return {"recommendation": body.strip(), "suggested_code": None}
 
     # Split by suggestion blocks
     lines = body.split("\n")
@@ -139,10 +459,11 @@ def clean_comment_body(body: str) -> str:
     in_suggestion = False
 
     for line in lines:
-        if line.strip().startswith("```suggestion"):
+        stripped = line.strip()
+        if stripped.startswith("```suggestion"):
             in_suggestion = True
             suggestion = []
-        elif line.strip() == "```" and in_suggestion:
+        elif stripped == "```" and in_suggestion:
             in_suggestion = False
         elif in_suggestion:
             suggestion.append(line)
@@ -163,128 +484,114 @@ def format_for_claude_analysis(
 ) -> str:
     """Format recommendations in a way that's easy for Claude to analyze."""
 
-    output = []
+    # Fixed-shape blocks are written as whole templates into one buffer
+    buf = io.StringIO()
+    w = buf.write
 
     # PR Context
-    output.append("# Gemini Code Review Analysis Request")
-    output.append("")
-    output.append(f"**PR #{pr_context['number']}: {pr_context['title']}**")
-    output.append("")
-    output.append("## PR Context")
-    output.append("")
-    output.append(f"- **Status:** {pr_context['state']}")
-    output.append(f"- **Files Changed:** {pr_context['files_changed']}")
-    output.append(f"- **Created:** {pr_context['created_at']}")
-    output.append("")
+    w(
+        "# Gemini Code Review Analysis Request\n"
+        "\n"
+        f"**PR #{pr_context['number']}: {pr_context['title']}**\n"
+        "\n"
+        "## PR Context\n"
+        "\n"
+        f"- **Status:** {pr_context['state']}\n"
+        f"- **Files Changed:** {pr_context['files_changed']}\n"
+        f"- **Created:** {pr_context['created_at']}\n"
+        "\n"
+    )
     if pr_context['body']:
-        output.append("**PR Description (excerpt):**")
-        output.append(f"> {pr_context['body']}")
-        output.append("")
+        w(f"**PR Description (excerpt):**\n> {pr_context['body']}\n\n")
 
     # Issue Comments (Complete Review)
     if issue_comments:
-        output.append("## Gemini's Complete Review")
-        output.append("")
-        output.append("**Source:** Issue comments (complete review with all issues/recommendations)")
-        output.append("")
+        w(
+            "## Gemini's Complete Review\n"
+            "\n"
+            "**Source:** Issue comments (complete review with all issues/recommendations)\n"
+            "\n"
+        )
         for comment in issue_comments:
-            output.append(comment["body"])
-            output.append("")
+            w(comment["body"])
+            w("\n\n")
 
     # Review Summary
     if review_summary:
-        output.append("## Gemini's Overall Review")
-        output.append("")
-        output.append("**Source:** PR review summary")
-        output.append("")
-        output.append(review_summary)
-        output.append("")
+        w(f"## Gemini's Overall Review\n\n**Source:** PR review summary\n\n{review_summary}\n\n")
 
     # Individual Inline Recommendations (if any)
     if inline_comments:
-        output.append("## Inline Code Recommendations")
-        output.append("")
-        output.append("**Source:** PR review inline comments")
-        output.append("")
-        output.append(f"**Total:** {len(inline_comments)} inline recommendations")
-        output.append("")
-
-        # Group by severity
-        high = [c for c in inline_comments if parse_severity(c["body"]) == "HIGH"]
-        medium = [c for c in inline_comments if parse_severity(c["body"]) == "MEDIUM"]
-        low = [c for c in inline_comments if parse_severity(c["body"]) == "LOW"]
-
-        output.append(f"**Severity Breakdown:** HIGH={len(high)}, MEDIUM={len(medium)}, LOW={len(low)}")
-        output.append("")
-        output.append("---")
-        output.append("")
+        # Classify each comment once, counting severities as we go
+        severities = [parse_severity(c["body"]) for c in inline_comments]
+        counts = {"HIGH": 0, "MEDIUM": 0, "LOW": 0, "UNSPECIFIED": 0}
+        for severity in severities:
+            counts[severity] += 1
+
+        w(
+            "## Inline Code Recommendations\n"
+            "\n"
+            "**Source:** PR review inline comments\n"
+            "\n"
+            f"**Total:** {len(inline_comments)} inline recommendations\n"
+            "\n"
+            f"**Severity Breakdown:** HIGH={counts['HIGH']}, MEDIUM={counts['MEDIUM']}, LOW={counts['LOW']}\n"
+            "\n"
+            "---\n"
+            "\n"
+        )
 
         # Output each recommendation
-        for i, comment in enumerate(inline_comments, 1):
-            severity = parse_severity(comment["body"])
+        for i, (comment, severity) in enumerate(zip(inline_comments, severities), 1):
             cleaned = clean_comment_body(comment["body"])
 
-            output.append(f"### Inline Recommendation {i} [{severity}]")
-            output.append("")
-            output.append(f"**Location:** `{comment.get('path', 'N/A')}:{comment.get('line', 'N/A')}`")
-            output.append("")
-            output.append("**Gemini's Feedback:**")
-            output.append("")
-            output.append(cleaned["recommendation"])
-            output.append("")
+            w(
+                f"### Inline Recommendation {i} [{severity}]\n"
+                "\n"
+                f"**Location:** `{comment.get('path', 'N/A')}:{comment.get('line', 'N/A')}`\n"
+                "\n"
+                "**Gemini's Feedback:**\n"
+                "\n"
+                f"{cleaned['recommendation']}\n"
+                "\n"
+            )
 
             if cleaned["suggested_code"]:
-                output.append("**Suggested Code Change:**")
-                output.append("```")
-                output.append(cleaned["suggested_code"])
-                output.append("```")
-                output.append("")
+                w(f"**Suggested Code Change:**\n```\n{cleaned['suggested_code']}\n```\n\n")
 
-            output.append("---")
-            output.append("")
+            w("---\n\n")
 
     # Analysis prompt for Claude
-    output.append("## Analysis Request")
-    output.append("")
-    output.append("For each recommendation above, please provide:")
-    output.append("")
-    output.append("1. **Your Evaluation:**")
-    output.append("   - Technical validity of the recommendation")
-    output.append("   - Relevance to current phase/goals")
-    output.append("   - Alignment with project architecture decisions")
-    output.append("")
-    output.append("2. **Disposition Recommendation:**")
-    output.append("   - **IMPLEMENT** - Valid, should be implemented now or soon")
-    output.append("   - **DEFER** - Valid, but defer to future phase")
-    output.append("   - **REJECT** - YAGNI, over-engineering, or conflicts with design")
-    output.append("   - **ALREADY_IMPLEMENTED** - Feature/fix already exists")
-    output.append("")
-    output.append("3. **Rationale:** One-sentence reasoning for your recommendation")
-    output.append("")
-    output.append("4. **Scope** (if IMPLEMENT): Brief description of implementation work")
-    output.append("")
-    output.append("Format your response as structured recommendations that we can directly")
-    output.append("transfer to the decision record (.user/gemini-decisions/gemini-recommendations.md).")
-
-    return "\n".join(output)
+    w(ANALYSIS_REQUEST)
+
+    return buf.getvalue()
 
 
 def main():
     """Main entry point."""
-    if len(sys.argv) != 2:
-        print("Usage: python analyze_gemini_recommendations.py <pr_number>")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(
+        description="Fetch Gemini review comments from a PR for disposition analysis"
+    )
+    parser.add_argument("pr_number", type=int, help="Pull request number")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Maximum concurrent GitHub requests (default: 4)",
+    )
+    args = parser.parse_args()
 
-    pr_number = int(sys.argv[1])
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+
+    pr_number = args.pr_number
 
     print(f"Fetching Gemini review for PR #{pr_number}...")
 
     try:
         # Fetch data
-        pr_context = fetch_pr_context(pr_number)
-        review_summary = fetch_gemini_review_summary(pr_number)
-        issue_comments = fetch_gemini_issue_comments(pr_number)
-        inline_comments = fetch_gemini_review_comments(pr_number)
+        bundle = fetch_gemini_bundle(pr_number) or fetch_all(pr_number, args.concurrency)
+        pr_context, review_summary, issue_comments, inline_comments = bundle
 
         # Check if we have any Gemini feedback
         if not issue_comments and not inline_comments and not review_summary:
@@ -315,14 +622,19 @@ def main():
         # Save to temp file for easy reference
         workspace_root = Path(__file__).parent.parent
         temp_file = workspace_root / ".user" / "gemini-decisions" / f"gemini-review-pr{pr_number}.md"
-        temp_file.parent.mkdir(parents=True, exist_ok=True)
-        temp_file.write_text(analysis_request)
+        # Usually exists already: one stat instead of a failing mkdir plus a stat
+        if not temp_file.parent.is_dir():
+            temp_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_file.write_bytes(analysis_request.encode("utf-8"))
 
         print("")
         print(f"Analysis request saved to: {temp_file}")
         print("")
         print("Next step: Review the recommendations above and provide your disposition analysis.")
 
+    except requests.RequestException as e:
+        print(f"Error calling GitHub API: {e}")
+        sys.exit(1)
     except subprocess.CalledProcessError as e:
         print(f"Error running gh command: {e}")
         print(f"   Stdout: {e.stdout}")
@@ -33,6 +33,7 @@ Usage:
 
 import json
 import sys
+from bisect import bisect_right
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -57,10 +58,12 @@ class DecisionRecorder:
 
     def __init__(self, recommendations_file: Path):
         self.recommendations_file = recommendations_file
-        if recommendations_file.exists():
-            self.content = recommendations_file.read_text()
+        self._today = datetime.now().strftime('%Y-%m-%d')
+        try:
+            with open(recommendations_file, "r", encoding="utf-8") as f:
+                self.content = f.read()
             self.lines = self.content.split("\n")
-        else:
+        except FileNotFoundError:
             # Create initial file structure
             self.lines = self._create_initial_structure()
 
@@ -69,7 +72,7 @@ class DecisionRecorder:
         return [
             "# Gemini Recommendations by PR",
             "",
-            f"**Last Review:** {datetime.now().strftime('%Y-%m-%d')}",
+            f"**Last Review:** {self._today}",
             "**Reviewer:** Claude Code Review Agent",
             "",
             "---",
@@ -98,34 +101,37 @@ class DecisionRecorder:
             "",
         ]
 
+    def _build_index(self) -> None:
+        """Index section headers and heading lines in a single pass."""
+        self._sections: dict[str, int] = {}
+        self._headings: list[int] = []
+        for i, line in enumerate(self.lines):
+            if line.startswith("##"):
+                self._headings.append(i)
+                self._sections.setdefault(line.strip(), i)
+
     def _find_section_insertion_point(self, section_header: str, pr_number: int) -> int:
         """Find where to insert items for a given section and PR."""
         # Find the section
-        section_idx = None
-        for i, line in enumerate(self.lines):
-            if line.strip() == section_header:
-                section_idx = i
-                break
-
+        section_idx = self._sections.get(section_header)
         if section_idx is None:
             raise ValueError(f"Section not found: {section_header}")
 
-        # Look for existing PR subsection
-        pr_header = f"### PR #{pr_number}"
-        for i in range(section_idx + 1, len(self.lines)):
-            if self.lines[i].strip() == pr_header:
-                # Found existing PR section, insert after existing items
-                for j in range(i + 1, len(self.lines)):
-                    if self.lines[j].startswith("###") or self.lines[j].startswith("##"):
-                        return j
-                return len(self.lines)  # End of file
+        # First heading after the section header
+        pos = bisect_right(self._headings, section_idx)
+        if pos == len(self._headings):
+            # Reached end without finding anything
+            return len(self.lines)
 
-            elif self.lines[i].startswith("##"):
-                # Hit next section without finding PR, insert here
-                return i
+        heading_idx = self._headings[pos]
+        if self.lines[heading_idx].strip() == f"### PR #{pr_number}":
+            # Found existing PR section, insert after existing items
+            if pos + 1 < len(self._headings):
+                return self._headings[pos + 1]
+            return len(self.lines)  # End of file
 
-        # Reached end without finding anything
-        return len(self.lines)
+        # Hit next section without finding PR, insert here
+        return heading_idx
 
     def record_decisions(self, pr_number: int, decisions: list[dict[str, Any]]) -> None:
         """Record all decisions for a PR."""
@@ -137,7 +143,10 @@ class DecisionRecorder:
                 by_disposition[disposition] = []
             by_disposition[disposition].append(decision)
 
-        # Add to each section
+        # Work out each section's insertion against the unmodified lines,
+        # then apply them all at the end
+        self._build_index()
+        edits: list[tuple[int, list[str]]] = []
         for disposition, items in by_disposition.items():
             section_header = self.SECTION_HEADERS[disposition]
             emoji = self.SECTION_EMOJI[disposition]
@@ -174,13 +183,16 @@ class DecisionRecorder:
                     new_lines.append(f"   - **File:** `{item['file']}:{item.get('line', 'N/A')}`")
                 new_lines.append("")
 
-            # Insert
+            edits.append((insertion_idx, new_lines))
+
+        # Insert bottom-up so earlier insertion points stay valid
+        for insertion_idx, new_lines in sorted(edits, key=lambda edit: edit[0], reverse=True):
             self.lines[insertion_idx:insertion_idx] = new_lines
 
         # Update last review date
         for i, line in enumerate(self.lines):
             if line.startswith("**Last Review:**"):
-                self.lines[i] = f"**Last Review:** {datetime.now().strftime('%Y-%m-%d')}"
+                self.lines[i] = f"**Last Review:** {self._today}"
                 break
 
     def save(self) -> None:
@@ -206,8 +218,7 @@ def main():
 
     try:
         # Load decisions
-        with open(decisions_file) as f:
-            data = json.load(f)
+        data = json.loads(decisions_file.read_bytes())
 
         decisions = data.get("decisions", [])
 
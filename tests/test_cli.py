@@ -1,12 +1,15 @@
+import os
+import threading
 import pytest
 from click.testing import CliRunner
 from pathlib import Path
 from unittest.mock import patch, MagicMock
-from md2pdf import cli, main
 
 @patch('md2pdf.prompt_file_selection')
 def test_cli_displays_welcome(mock_files):
     """Test CLI displays welcome message"""
+    from md2pdf import cli
+
     # Mock file selection to avoid interactive prompt
     mock_files.return_value = []
 
@@ -18,9 +21,23 @@ def test_cli_displays_welcome(mock_files):
 
 def test_main_entry_point():
     """Test main() entry point exists"""
+    from md2pdf import main
+
     # main() should be callable
     assert callable(main)
 
+def test_glob_files_extensions(tmp_path):
+    """Test glob results filtered by extension"""
+    from md2pdf import glob_files
+
+    (tmp_path / "a.md").write_text("# A")
+    (tmp_path / "b.MARKDOWN").write_text("# B")
+    (tmp_path / "c.txt").write_text("C")
+
+    files = glob_files(str(tmp_path / "*"), extensions=('.md', '.markdown'))
+    assert [f.name for f in files] == ["a.md", "b.MARKDOWN"]
+    assert glob_files(str(tmp_path / "c.txt"), extensions=('.md',)) == []
+
 @patch('md2pdf.prompt_file_selection')
 @patch('md2pdf.prompt_output_format')
 @patch('md2pdf.prompt_theme_selection')
@@ -28,6 +45,8 @@ def test_main_entry_point():
 @patch('md2pdf.process_conversion')
 def test_cli_interactive_flow_single_file(mock_process, mock_filename, mock_theme, mock_format, mock_files):
     """Test interactive flow for single file"""
+    from md2pdf import cli
+
     runner = CliRunner()
 
     # Mock responses
@@ -51,6 +70,8 @@ def test_cli_interactive_flow_single_file(mock_process, mock_filename, mock_them
 @patch('md2pdf.process_conversion')
 def test_cli_interactive_flow_batch_mode(mock_process, mock_theme, mock_format, mock_files):
     """Test interactive flow for batch processing"""
+    from md2pdf import cli
+
     runner = CliRunner()
 
     # Mock responses for batch
@@ -66,19 +87,23 @@ def test_cli_interactive_flow_batch_mode(mock_process, mock_theme, mock_format,
 
 # ===== File Selection Tests (Task 2.5) =====
 
-def test_glob_files_pattern(tmp_path):
+@pytest.fixture
+def md_tree(tmp_path):
+    """Provide a directory with three markdown files and one text file"""
+    # Created out of order so sorting is actually exercised
+    for name in ("c", "a", "b"):
+        (tmp_path / f"{name}.md").write_text(f"# {name.upper()}")
+    (tmp_path / "notes.txt").write_text("notes")
+    return tmp_path
+
+def test_glob_files_pattern(md_tree):
     """Test glob pattern matching"""
     from md2pdf import glob_files
 
-    # Create test structure
-    (tmp_path / "doc1.md").write_text("# Doc 1")
-    (tmp_path / "doc2.md").write_text("# Doc 2")
-    (tmp_path / "notes.txt").write_text("notes")
-
-    files = glob_files(str(tmp_path / "*.md"))
-    assert len(files) == 2
+    files = glob_files(str(md_tree / "*.md"))
+    assert len(files) == 3
     assert all(f.suffix == '.md' for f in files)
-    assert all(f.parent == tmp_path for f in files)
+    assert all(f.parent == md_tree for f in files)
 
 def test_glob_files_recursive(tmp_path):
     """Test recursive glob pattern"""
@@ -100,16 +125,11 @@ def test_glob_files_no_matches(tmp_path):
     files = glob_files(str(tmp_path / "*.md"))
     assert len(files) == 0
 
-def test_glob_files_sorted(tmp_path):
+def test_glob_files_sorted(md_tree):
     """Test that glob results are sorted"""
     from md2pdf import glob_files
 
-    # Create files in specific order
-    (tmp_path / "c.md").write_text("# C")
-    (tmp_path / "a.md").write_text("# A")
-    (tmp_path / "b.md").write_text("# B")
-
-    files = glob_files(str(tmp_path / "*.md"))
+    files = glob_files(str(md_tree / "*.md"))
     names = [f.name for f in files]
     assert names == ["a.md", "b.md", "c.md"]
 
@@ -132,6 +152,8 @@ def test_glob_files_single_file(tmp_path):
 @patch('md2pdf.process_conversion')
 def test_prompt_file_selection_integration_single_file(mock_process, mock_filename, mock_theme, mock_format, mock_files, tmp_path):
     """Test file selection integration with single file"""
+    from md2pdf import cli
+
     test_file = tmp_path / "test.md"
     test_file.write_text("# Test")
 
@@ -154,6 +176,8 @@ def test_prompt_file_selection_integration_single_file(mock_process, mock_filena
 @patch('md2pdf.process_conversion')
 def test_prompt_file_selection_integration_batch(mock_process, mock_theme, mock_format, mock_files, tmp_path):
     """Test file selection integration with batch mode"""
+    from md2pdf import cli
+
     # Create multiple test files
     files = [
         tmp_path / "test1.md",
@@ -185,17 +209,12 @@ def test_file_selection_logic_single_markdown(tmp_path):
     assert test_file.is_file()
     assert test_file.suffix == '.md'
 
-def test_file_selection_logic_batch_markdown(tmp_path):
+def test_file_selection_logic_batch_markdown(md_tree):
     """Test file selection logic with batch markdown files"""
     from md2pdf import glob_files
 
-    # Create multiple test files
-    (tmp_path / "test1.md").write_text("# Test 1")
-    (tmp_path / "test2.md").write_text("# Test 2")
-    (tmp_path / "test3.md").write_text("# Test 3")
-
     # Use glob to find files
-    files = glob_files(str(tmp_path / "*.md"))
+    files = glob_files(str(md_tree / "*.md"))
 
     assert len(files) == 3
     assert all(f.suffix == '.md' for f in files)
@@ -241,6 +260,23 @@ def test_prompt_output_format_invalid_then_valid(monkeypatch):
 
     assert result == 'pdf'
 
+def test_prompt_output_format_injected_reader():
+    """Test prompts read answers from an injected reader instead of input()"""
+    from md2pdf import prompt_output_format
+
+    answers = iter(['x', '2'])
+    prompts = []
+
+    def read(prompt):
+        prompts.append(prompt)
+        return next(answers)
+
+    config = {'output': {'format': 'pdf'}}
+    result = prompt_output_format(config, read=read)
+
+    assert result == 'html'
+    assert prompts == ["Select format [1-2] (default: 1): "] * 2
+
 # ===== Task 2: Interactive Theme Selection Prompt Tests =====
 
 def test_prompt_theme_selection_valid(monkeypatch):
@@ -286,6 +322,16 @@ def test_prompt_theme_selection_invalid_then_valid(monkeypatch):
     from theme_manager import list_themes
     assert result in list_themes()
 
+def test_prompt_theme_selection_numeric_forms():
+    """Test choices are parsed as numbers, so '02' and '+2' pick the second theme"""
+    from md2pdf import prompt_theme_selection
+    from theme_manager import list_themes
+
+    config = {'output': {'default_theme': 'academic'}}
+    for answer in ('02', '+2', ' 2 '):
+        inputs = iter([answer])
+        assert prompt_theme_selection(config, read=lambda _: next(inputs)) == list_themes()[1]
+
 # ===== Task 3: Interactive Filename Prompt Tests =====
 
 def test_prompt_filename_accepts_default(monkeypatch):
@@ -348,7 +394,15 @@ def test_prompt_filename_wrong_extension_corrected(monkeypatch):
 
 # ===== Task 5: Process Conversion Integration Tests =====
 
-def test_process_conversion_pdf_creates_file(tmp_path, monkeypatch):
+@pytest.fixture
+def conversion_cache(tmp_path, monkeypatch):
+    """Keep the conversion cache out of the user's cache directory"""
+    cache_file = tmp_path / "cache" / "conversions.json"
+    monkeypatch.setattr("md2pdf.CONVERSION_CACHE_FILE", cache_file)
+    return cache_file
+
+
+def test_process_conversion_pdf_creates_file(tmp_path, monkeypatch, conversion_cache):
     """Test PDF conversion creates output file"""
     from md2pdf import process_conversion
     from pathlib import Path
@@ -386,7 +440,7 @@ def test_process_conversion_pdf_creates_file(tmp_path, monkeypatch):
     assert output_file.stat().st_size > 0
 
 
-def test_process_conversion_html_creates_file(tmp_path, monkeypatch):
+def test_process_conversion_html_creates_file(tmp_path, monkeypatch, conversion_cache):
     """Test HTML conversion creates output file"""
     from md2pdf import process_conversion
     from pathlib import Path
@@ -429,7 +483,7 @@ def runner():
     return CliRunner()
 
 
-def test_full_cli_integration_pdf(tmp_path, monkeypatch, runner):
+def test_full_cli_integration_pdf(tmp_path, monkeypatch, runner, conversion_cache):
     """Test complete CLI flow for PDF generation"""
     from md2pdf import cli
 
@@ -474,7 +528,7 @@ The equation is $E = mc^2$
     assert pdf_file.stat().st_size > 0
 
 
-def test_full_cli_integration_html(tmp_path, monkeypatch, runner):
+def test_full_cli_integration_html(tmp_path, monkeypatch, runner, conversion_cache):
     """Test complete CLI flow for HTML generation"""
     from md2pdf import cli
 
@@ -500,3 +554,193 @@ def test_full_cli_integration_html(tmp_path, monkeypatch, runner):
     assert html_file.exists()
     content = html_file.read_text()
     assert '<!DOCTYPE html>' in content
+
+
+def test_process_conversion_html_batch(tmp_path, monkeypatch, conversion_cache):
+    """Test batch HTML conversion builds every file in order"""
+    from md2pdf import process_conversion
+
+    files = []
+    for i in range(3):
+        md_file = tmp_path / f"doc{i}.md"
+        md_file.write_text(f"# Doc {i}\n\nBody {i}")
+        files.append(md_file)
+
+    monkeypatch.chdir(tmp_path)
+
+    process_conversion(
+        files=files,
+        output_format='html',
+        theme='academic',
+        filename=None,
+        config={'rendering': {'mermaid_theme': 'default'}}
+    )
+
+    for i in range(3):
+        content = (tmp_path / f"doc{i}.html").read_text()
+        assert f'<h1>Doc {i}</h1>' in content
+
+
+def test_process_conversion_pdf_batch_single_renderer(tmp_path, monkeypatch, conversion_cache):
+    """Test batch PDF conversion starts one renderer for all files"""
+    from md2pdf import process_conversion
+
+    files = []
+    for i in range(4):
+        md_file = tmp_path / f"doc{i}.md"
+        md_file.write_text(f"# Doc {i}")
+        files.append(md_file)
+
+    monkeypatch.chdir(tmp_path)
+
+    with patch("md2pdf.RendererClient") as mock_client:
+        mock_instance = MagicMock()
+        mock_instance.__enter__ = MagicMock(return_value=mock_instance)
+        mock_instance.__exit__ = MagicMock(return_value=False)
+        mock_instance.render_pdf_to_file.side_effect = (
+            lambda html, path, opts: path.write_text(html, encoding='utf-8')
+        )
+        mock_client.return_value = mock_instance
+
+        process_conversion(
+            files=files,
+            output_format='pdf',
+            theme='academic',
+            filename=None,
+            config={'rendering': {'mermaid_theme': 'default'}}
+        )
+
+    assert mock_client.call_count == 1
+    assert mock_instance.render_pdf_to_file.call_count == 4
+    for i in range(4):
+        assert f'<h1>Doc {i}</h1>' in (tmp_path / f"doc{i}.pdf").read_text()
+
+
+def test_process_conversion_rejects_duplicate_outputs(tmp_path, monkeypatch, conversion_cache):
+    """Test same-stem inputs from different directories are not written concurrently"""
+    import click
+    from md2pdf import process_conversion
+
+    files = []
+    for name in ("a", "b"):
+        (tmp_path / name).mkdir()
+        md_file = tmp_path / name / "README.md"
+        md_file.write_text(f"# {name}")
+        files.append(md_file)
+
+    monkeypatch.chdir(tmp_path)
+
+    with pytest.raises(click.ClickException, match="README.html"):
+        process_conversion(
+            files=files, output_format='html', theme='academic',
+            filename=None, config={'rendering': {'mermaid_theme': 'default'}}
+        )
+
+    assert not (tmp_path / "README.html").exists()
+
+
+def test_process_conversion_records_outputs_before_failure(tmp_path, monkeypatch, conversion_cache):
+    """Test outputs written before a render error are kept in the cache"""
+    from md2pdf import process_conversion
+    from renderer_client import RendererServerError
+
+    files = []
+    for i in range(3):
+        md_file = tmp_path / f"doc{i}.md"
+        md_file.write_text(f"# Doc {i}")
+        files.append(md_file)
+
+    monkeypatch.chdir(tmp_path)
+
+    # The first run holds every render until all three are under way, so
+    # the failure cannot cancel the others before they start
+    started = threading.Barrier(3, timeout=5)
+
+    def render(html, path, opts):
+        started.wait()
+        if path.name == "doc1.pdf":
+            raise RendererServerError("PDF rendering failed")
+        path.write_text(html, encoding='utf-8')
+
+    def convert():
+        mock_instance = MagicMock()
+        mock_instance.__enter__ = MagicMock(return_value=mock_instance)
+        mock_instance.__exit__ = MagicMock(return_value=False)
+        mock_instance.render_pdf_to_file.side_effect = render
+
+        with patch("md2pdf.RendererClient", return_value=mock_instance):
+            with pytest.raises(RendererServerError):
+                process_conversion(
+                    files=files, output_format='pdf', theme='academic',
+                    filename=None, config={'rendering': {'mermaid_theme': 'default'}}
+                )
+        return mock_instance
+
+    convert()
+
+    # Only the failed file is rendered again
+    started = threading.Barrier(1)
+    mock_instance = convert()
+    rendered = [call.args[1].name for call in mock_instance.render_pdf_to_file.call_args_list]
+    assert rendered == ["doc1.pdf"]
+
+
+def test_process_conversion_skips_up_to_date(tmp_path, monkeypatch, conversion_cache):
+    """Test unchanged sources are not reconverted unless forced"""
+    from md2pdf import process_conversion
+
+    md_file = tmp_path / "doc.md"
+    md_file.write_text("# Doc")
+    config = {'rendering': {'mermaid_theme': 'default'}}
+    monkeypatch.chdir(tmp_path)
+
+    def convert(**kwargs):
+        process_conversion(
+            files=[md_file], output_format='html', theme='academic',
+            filename=None, config=config, **kwargs
+        )
+
+    convert()
+    output_file = tmp_path / "doc.html"
+    output_file.write_text("sentinel")
+
+    # Unchanged source (even if touched) is skipped
+    os.utime(md_file, ns=(0, 0))
+    convert()
+    assert output_file.read_text() == "sentinel"
+
+    # Forced or changed source is reconverted
+    convert(force=True)
+    assert '<h1>Doc</h1>' in output_file.read_text()
+
+    output_file.write_text("sentinel")
+    md_file.write_text("# Changed")
+    convert()
+    assert '<h1>Changed</h1>' in output_file.read_text()
+
+
+def test_process_conversion_reconverts_on_theme_change(tmp_path, monkeypatch, conversion_cache):
+    """Test edited theme CSS invalidates outputs, and the cache stays out of the cwd"""
+    from md2pdf import process_conversion
+
+    md_file = tmp_path / "doc.md"
+    md_file.write_text("# Doc")
+    monkeypatch.chdir(tmp_path)
+
+    def convert():
+        process_conversion(
+            files=[md_file], output_format='html', theme='academic',
+            filename=None, config={'rendering': {'mermaid_theme': 'default'}}
+        )
+
+    convert()
+    output_file = tmp_path / "doc.html"
+    output_file.write_text("sentinel")
+
+    monkeypatch.setattr("document_builder.load_theme_css", lambda name: "body { color: red; }")
+    convert()
+
+    assert 'color: red' in output_file.read_text()
+    assert conversion_cache.exists()
+    assert not (tmp_path / ".md2pdf-cache.json").exists()
+
@@ -72,3 +72,30 @@ def test_get_theme_config():
     }
     theme_cfg = get_theme_config('academic', config)
     assert theme_cfg['mermaid_theme'] == 'default'
+
+def test_load_config_cache_invalidated_on_change(tmp_path):
+    """Test cached config is reused until the file changes"""
+    load_config.cache_clear()
+    custom_config = tmp_path / "custom.yaml"
+    custom_config.write_text("output:\n  format: html\n")
+
+    first = load_config(custom_config)
+    first['output']['format'] = 'mutated'
+    assert load_config(custom_config)['output']['format'] == 'html'
+
+    custom_config.write_text("output:\n  format: pdf\n  extra: true\n")
+    assert load_config(custom_config)['output']['format'] == 'pdf'
+
+def test_load_config_missing_file(tmp_path):
+    """Test missing config file raises FileNotFoundError"""
+    with pytest.raises(FileNotFoundError):
+        load_config(tmp_path / "missing.yaml")
+
+def test_load_config_large_file(tmp_path):
+    """Test loading a config large enough to be memory-mapped"""
+    custom_config = tmp_path / "large.yaml"
+    padding = "".join(f"# padding line {i}\n" for i in range(500))
+    custom_config.write_text(padding + "output:\n  format: html\n")
+
+    config = load_config(custom_config)
+    assert config['output']['format'] == 'html'
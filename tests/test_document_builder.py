@@ -60,3 +60,45 @@ def test_build_html_document_includes_mermaid_theme():
     )
 
     assert "theme: 'dark'" in html
+
+
+def test_build_html_document_reuses_compiled_template():
+    """Test the base template is compiled once across builds"""
+    from document_builder import _get_template
+
+    config = {'rendering': {'mermaid_theme': 'default'}}
+    _get_template.cache_clear()
+
+    first = build_html_document("# One", 'academic', config)
+    second = build_html_document("# Two", 'academic', config)
+
+    assert '<h1>One</h1>' in first
+    assert '<h1>Two</h1>' in second
+    assert _get_template.cache_info().misses == 1
+    assert _get_template.cache_info().hits == 1
+
+
+def test_build_html_document_reuses_theme_manager():
+    """Test one ThemeManager is shared while the config object is unchanged"""
+    from document_builder import _get_theme_manager
+
+    config = {'rendering': {'mermaid_theme': 'default'}}
+    other = {'rendering': {'mermaid_theme': 'default'}}
+
+    assert _get_theme_manager(config) is _get_theme_manager(config)
+    assert _get_theme_manager(other).config is other
+
+
+def test_render_document_with_prepared_context():
+    """Test a prepared theme context builds the same document"""
+    import pickle
+    from document_builder import prepare_theme_context, render_document
+
+    config = {'themes': {'modern': {'mermaid_theme': 'forest'}}}
+    context = prepare_theme_context('modern', config)
+
+    # Contexts are sent to worker processes
+    context = pickle.loads(pickle.dumps(context))
+
+    assert context.mermaid_theme == 'forest'
+    assert render_document("# Doc", context) == build_html_document("# Doc", 'modern', config)
@@ -0,0 +1,128 @@
+"""Tests for file_finder module."""
+
+import os
+import pytest
+from file_finder import glob_files
+
+
+def test_glob_files_skips_hidden(tmp_path):
+    """Test wildcards skip hidden names unless the pattern starts with a dot."""
+    (tmp_path / "visible.md").write_text("# Visible")
+    (tmp_path / ".hidden.md").write_text("# Hidden")
+    (tmp_path / ".git").mkdir()
+    (tmp_path / ".git" / "notes.md").write_text("# Notes")
+
+    assert [f.name for f in glob_files(str(tmp_path / "**" / "*.md"))] == ["visible.md"]
+    assert [f.name for f in glob_files(str(tmp_path / ".*.md"))] == [".hidden.md"]
+
+
+def test_glob_files_literal_segments(tmp_path):
+    """Test literal segments after a wildcard are joined, not listed."""
+    for name in ("a", "b"):
+        (tmp_path / name / "docs").mkdir(parents=True)
+        (tmp_path / name / "docs" / "guide.md").write_text("# Guide")
+    (tmp_path / "c").mkdir()
+
+    files = glob_files(str(tmp_path / "*" / "docs" / "guide.md"))
+    assert files == [
+        tmp_path / "a" / "docs" / "guide.md",
+        tmp_path / "b" / "docs" / "guide.md",
+    ]
+
+
+def test_glob_segments_compiled_once(tmp_path):
+    """Test wildcard segments are compiled once across repeated patterns."""
+    from file_finder import _compile_segment
+
+    (tmp_path / "doc.md").write_text("# Doc")
+    _compile_segment.cache_clear()
+
+    for _ in range(3):
+        assert len(glob_files(str(tmp_path / "*.md"))) == 1
+
+    assert _compile_segment.cache_info().misses == 1
+
+
+def test_read_markdown_large_file(tmp_path, monkeypatch):
+    """Test memory-mapped reads match read_text."""
+    import file_finder
+
+    md_file = tmp_path / "large.md"
+    md_file.write_text("# Größe\n\n" + "Zeile ✓\n" * 1000, encoding="utf-8")
+
+    monkeypatch.setattr(file_finder, "MMAP_READ_THRESHOLD", 1)
+    assert file_finder.read_markdown(md_file) == md_file.read_text(encoding="utf-8")
+
+    # CRLF and lone CR line endings are translated like read_text
+    md_file.write_bytes("# Größe\r\n\r\nZeile ✓\rZeile ✓\r\n".encode("utf-8"))
+    assert file_finder.read_markdown(md_file) == md_file.read_text(encoding="utf-8")
+    assert file_finder.read_markdown(md_file) == "# Größe\n\nZeile ✓\nZeile ✓\n"
+
+
+def test_glob_files_prunes_ignored_dirs(tmp_path):
+    """Test '**' never enters ignored directories."""
+    (tmp_path / "node_modules" / "pkg").mkdir(parents=True)
+    (tmp_path / "node_modules" / "pkg" / "readme.md").write_text("# Vendored")
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "guide.md").write_text("# Guide")
+
+    pattern = str(tmp_path / "**" / "*.md")
+
+    assert glob_files(pattern) == [tmp_path / "docs" / "guide.md"]
+    assert len(glob_files(pattern, ignore_dirs=frozenset())) == 2
+
+
+def test_ignore_dirs_from_config():
+    """Test files.ignore_dirs falls back when empty and rejects non-lists."""
+    from file_finder import IGNORED_DIRS, ignore_dirs_from_config
+
+    assert ignore_dirs_from_config({}) == IGNORED_DIRS
+    assert ignore_dirs_from_config({'files': None}) == IGNORED_DIRS
+    assert ignore_dirs_from_config({'files': {'ignore_dirs': ['build']}}) == {'build'}
+
+    for bad in ('build', ['build', 3], 5):
+        with pytest.raises(ValueError):
+            ignore_dirs_from_config({'files': {'ignore_dirs': bad}})
+
+
+def test_glob_files_reuses_listing_until_mtime_changes(tmp_path):
+    """Test shared directory listings are reused until the directory's mtime changes."""
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    (docs / "a.md").write_text("# A")
+    os.utime(docs, ns=(10**18, 10**18))
+
+    pattern = str(docs / "*.md")
+    listings = {}
+    assert len(glob_files(pattern, listings=listings)) == 1
+
+    # Same mtime: the shared listing is reused, but a fresh call lists again
+    (docs / "b.md").write_text("# B")
+    os.utime(docs, ns=(10**18, 10**18))
+    assert len(glob_files(pattern, listings=listings)) == 1
+    assert len(glob_files(pattern)) == 2
+
+    os.utime(docs, ns=(10**18, 10**18 + 1))
+    assert len(glob_files(pattern, listings=listings)) == 2
+
+
+def test_glob_files_repeated_recursive_segments(tmp_path):
+    """Test files reachable through several '**' routes are listed once."""
+    (tmp_path / "a" / "b").mkdir(parents=True)
+    for name in ("x.md", "a/y.md", "a/b/z.md"):
+        (tmp_path / name).write_text("# Doc")
+
+    for pattern in ("**/**/*.md", "**/*/**/*.md"):
+        files = glob_files(str(tmp_path / pattern))
+        assert len(files) == len(set(files))
+
+    assert len(glob_files(str(tmp_path / "**" / "**" / "*.md"))) == 3
+
+
+def test_glob_files_recursive_skips_symlinked_dirs(tmp_path):
+    """Test '**' does not follow directory symlinks, so cycles terminate."""
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "guide.md").write_text("# Guide")
+    (tmp_path / "docs" / "loop").symlink_to(tmp_path, target_is_directory=True)
+
+    assert glob_files(str(tmp_path / "**" / "*.md")) == [tmp_path / "docs" / "guide.md"]
@@ -96,3 +96,25 @@ def very_long_function_name(param1, param2, param3):
     assert '<pre>' in html
     assert '<code' in html
     assert 'very_long_function_name' in html
+
+
+def test_render_markdown_cache_bounded(monkeypatch):
+    """Test repeated content is served from the bounded render cache"""
+    import markdown_renderer
+
+    monkeypatch.setattr(markdown_renderer, '_RENDER_CACHE_SIZE', 2)
+    markdown_renderer._render_cache.clear()
+
+    first = render_markdown("# One")
+    assert render_markdown("# One") is first
+
+    render_markdown("# Two")
+    render_markdown("# Three")
+    assert len(markdown_renderer._render_cache) == 2
+    assert render_markdown("# One") == '<h1>One</h1>\n'
+
+
+def test_extract_title_not_on_first_line():
+    """Test H1 found after other headings and blank H1 lines"""
+    assert extract_title("## Subtitle\n\n# Real Title  \n") == "Real Title"
+    assert extract_title("# \n# Second") == "Second"
@@ -11,21 +11,21 @@ from md2pdf_batch import (
     convert_file,
     process_batch,
     load_skill_config,
+    parse_args,
     save_skill_config,
     DEFAULT_CONFIG,
 )
 
 
-def test_cli_help():
+def test_cli_help(capsys):
     """Test CLI responds to --help."""
-    result = subprocess.run(
-        [sys.executable, "md2pdf_batch.py", "--help"],
-        capture_output=True,
-        text=True
-    )
-    assert result.returncode == 0
-    assert "usage:" in result.stdout.lower()
-    assert "--files" in result.stdout
+    with pytest.raises(SystemExit) as exc_info:
+        parse_args(["--help"])
+
+    assert exc_info.value.code == 0
+    out = capsys.readouterr().out
+    assert "usage:" in out.lower()
+    assert "--files" in out
 
 
 def test_resolve_single_file(tmp_path):
@@ -71,7 +71,6 @@ def test_convert_file_pdf(tmp_path):
         mock_instance = MagicMock()
         mock_instance.__enter__ = MagicMock(return_value=mock_instance)
         mock_instance.__exit__ = MagicMock(return_value=False)
-        mock_instance.render_pdf.return_value = b"%PDF-1.4 fake pdf"
         mock_client.return_value = mock_instance
 
         result = convert_file(
@@ -85,6 +84,8 @@ def test_convert_file_pdf(tmp_path):
     assert result["input"] == md_file
     assert result["output"].suffix == ".pdf"
     assert result["output"].parent == md_file.parent
+    mock_instance.render_pdf_to_file.assert_called_once()
+    assert mock_instance.render_pdf_to_file.call_args.args[1] == result["output"]
 
 
 def test_convert_file_html(tmp_path):
@@ -273,3 +274,102 @@ def test_full_cli_batch_conversion(tmp_path):
     # Verify all outputs exist
     for i in range(3):
         assert (tmp_path / f"batch{i}.html").exists()
+
+
+def test_process_batch_single_job(tmp_path):
+    """Test batch processing in-process with jobs=1 keeps input order."""
+    files = []
+    for name in ("b", "a", "c"):
+        md_file = tmp_path / f"{name}.md"
+        md_file.write_text(f"# {name}")
+        files.append(md_file)
+
+    results = process_batch(
+        files=files,
+        format="html",
+        theme="academic",
+        output_dir=None,
+        jobs=1
+    )
+
+    assert [r["input"] for r in results] == files
+    assert all(r["success"] for r in results)
+
+
+def test_process_batch_pdf_single_renderer(tmp_path):
+    """Test a PDF batch starts one renderer for all files."""
+    files = []
+    for i in range(3):
+        md_file = tmp_path / f"doc{i}.md"
+        md_file.write_text(f"# Doc {i}")
+        files.append(md_file)
+
+    with patch("md2pdf_batch.RendererClient") as mock_client:
+        mock_instance = MagicMock()
+        mock_client.return_value = mock_instance
+
+        results = process_batch(
+            files=files,
+            format="pdf",
+            theme="academic",
+            output_dir=None
+        )
+
+    assert all(r["success"] for r in results)
+    assert mock_client.call_count == 1
+    mock_instance.start_server.assert_called_once()
+    mock_instance.stop_server.assert_called_once()
+    assert mock_instance.render_pdf_to_file.call_count == 3
+
+
+def test_process_batch_pdf_single_job_in_process(tmp_path):
+    """Test jobs=1 renders PDFs one at a time without a thread pool."""
+    files = []
+    for i in range(3):
+        md_file = tmp_path / f"doc{i}.md"
+        md_file.write_text(f"# Doc {i}")
+        files.append(md_file)
+
+    with patch("md2pdf_batch.RendererClient") as mock_client, \
+            patch("md2pdf_batch.ThreadPoolExecutor") as mock_pool:
+        mock_client.return_value = MagicMock()
+
+        results = process_batch(
+            files=files,
+            format="pdf",
+            theme="academic",
+            output_dir=None,
+            jobs=1
+        )
+
+    assert all(r["success"] for r in results)
+    mock_pool.assert_not_called()
+
+
+def test_process_batch_rejects_colliding_outputs(tmp_path):
+    """Test same-stem inputs sent to one output directory are not converted."""
+    out_dir = tmp_path / "out"
+    out_dir.mkdir()
+    files = []
+    for name in ("a", "b"):
+        (tmp_path / name).mkdir()
+        md_file = tmp_path / name / "README.md"
+        md_file.write_text(f"# {name}")
+        files.append(md_file)
+    other = tmp_path / "other.md"
+    other.write_text("# Other")
+    files.append(other)
+
+    results = process_batch(
+        files=files,
+        format="html",
+        theme="minimal",
+        output_dir=out_dir
+    )
+
+    assert [r["input"] for r in results] == files
+    assert [r["success"] for r in results] == [False, False, True]
+    assert "README.html" in results[0]["error"]
+    assert not (out_dir / "README.html").exists()
+    assert (out_dir / "other.html").exists()
+
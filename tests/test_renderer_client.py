@@ -1,8 +1,16 @@
+import json
 import pytest
+import requests
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 from renderer_client import RendererClient, RendererServerError, RendererTimeoutError
 
+@pytest.fixture(scope="module")
+def running_client():
+    """One renderer server shared by the tests that only send requests"""
+    with RendererClient() as client:
+        yield client
+
 def test_renderer_client_init():
     """Test RendererClient initialization"""
     client = RendererClient()
@@ -24,45 +32,30 @@ def test_start_server():
     # Cleanup
     client.stop_server()
 
-def test_health_check():
+def test_health_check(running_client):
     """Test health check endpoint"""
-    client = RendererClient()
-    client.start_server()
-
     # Should return healthy status
-    health = client.health_check()
+    health = running_client.health_check()
     assert health['status'] == 'healthy'
     assert health['service'] == 'md2pdf-renderer'
 
-    client.stop_server()
-
-def test_render_pdf():
+def test_render_pdf(running_client):
     """Test PDF rendering"""
-    client = RendererClient()
-    client.start_server()
-
     html = "<html><body><h1>Test</h1></body></html>"
-    pdf_bytes = client.render_pdf(html)
+    pdf_bytes = running_client.render_pdf(html)
 
     # Verify PDF header
     assert pdf_bytes.startswith(b'%PDF-')
     assert len(pdf_bytes) > 0
 
-    client.stop_server()
-
-def test_render_html():
+def test_render_html(running_client):
     """Test HTML rendering"""
-    client = RendererClient()
-    client.start_server()
-
     html = "<html><body><h1>Test</h1></body></html>"
-    html_output = client.render_html(html)
+    html_output = running_client.render_html(html)
 
     assert '<h1>Test</h1>' in html_output
     assert isinstance(html_output, str)
 
-    client.stop_server()
-
 def test_stop_server():
     """Test stopping the server"""
     client = RendererClient()
@@ -87,11 +80,8 @@ def test_context_manager():
     # Server should be stopped after exiting context
     assert not client.is_server_running()
 
-def test_render_pdf_with_options():
+def test_render_pdf_with_options(running_client):
     """Test PDF rendering with custom options"""
-    client = RendererClient()
-    client.start_server()
-
     html = "<html><body><h1>Test</h1></body></html>"
     options = {
         'pageSize': 'A4',
@@ -99,7 +89,87 @@ def test_render_pdf_with_options():
         'printBackground': True
     }
 
-    pdf_bytes = client.render_pdf(html, options)
+    pdf_bytes = running_client.render_pdf(html, options)
     assert pdf_bytes.startswith(b'%PDF-')
 
-    client.stop_server()
+def test_requests_share_session():
+    """Test requests reuse one keep-alive session until the server stops"""
+    client = RendererClient()
+
+    with patch('renderer_client.requests.Session') as mock_session_cls:
+        session = mock_session_cls.return_value
+        session.post.return_value.content = b'%PDF-1.4 fake'
+
+        client.render_pdf("<html></html>")
+        client.render_pdf("<html></html>")
+
+        assert mock_session_cls.call_count == 1
+        assert session.post.call_count == 2
+
+        client.stop_server()
+        session.close.assert_called_once()
+
+def test_port_open():
+    """Test the TCP probe used while waiting for the server"""
+    import socket
+
+    with socket.socket() as listener:
+        listener.bind(('localhost', 0))
+        listener.listen()
+        port = listener.getsockname()[1]
+
+        assert RendererClient(port=port)._port_open()
+
+    assert not RendererClient(port=port)._port_open()
+
+def test_render_pdf_sends_raw_html():
+    """Test HTML is posted as the raw body with options in a header"""
+    client = RendererClient()
+
+    with patch('renderer_client.requests.Session') as mock_session_cls:
+        session = mock_session_cls.return_value
+        session.post.return_value.content = b'%PDF-1.4 fake'
+
+        client.render_pdf("<p>café</p>", {'pageSize': 'A4'})
+
+        kwargs = session.post.call_args.kwargs
+        assert kwargs['data'] == "<p>café</p>".encode('utf-8')
+        assert kwargs['headers']['Content-Type'] == 'text/html; charset=utf-8'
+        assert json.loads(kwargs['headers']['X-PDF-Options']) == {'pageSize': 'A4'}
+
+
+def test_render_pdf_to_file_streams(tmp_path):
+    """Test the PDF response is streamed into the output file"""
+    client = RendererClient()
+    output = tmp_path / "out.pdf"
+
+    with patch('renderer_client.requests.Session') as mock_session_cls:
+        response = mock_session_cls.return_value.post.return_value.__enter__.return_value
+        response.iter_content.return_value = [b'%PDF-', b'1.4 fake']
+
+        client.render_pdf_to_file("<p>x</p>", output)
+
+        assert mock_session_cls.return_value.post.call_args.kwargs['stream'] is True
+    assert output.read_bytes() == b'%PDF-1.4 fake'
+    assert list(tmp_path.iterdir()) == [output]
+
+
+def test_render_pdf_to_file_keeps_existing_output_on_failure(tmp_path):
+    """Test a failed stream keeps the previous PDF and leaves no partial file"""
+    client = RendererClient()
+    output = tmp_path / "out.pdf"
+    output.write_bytes(b'%PDF-1.4 last good render')
+
+    def chunks(chunk_size):
+        yield b'%PDF-'
+        raise requests.ConnectionError("connection reset")
+
+    with patch('renderer_client.requests.Session') as mock_session_cls:
+        response = mock_session_cls.return_value.post.return_value.__enter__.return_value
+        response.iter_content.side_effect = chunks
+
+        with pytest.raises(RendererServerError):
+            client.render_pdf_to_file("<p>x</p>", output)
+
+    assert output.read_bytes() == b'%PDF-1.4 last good render'
+    assert list(tmp_path.iterdir()) == [output]
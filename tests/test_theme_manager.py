@@ -1,6 +1,6 @@
 import pytest
 from pathlib import Path
-from theme_manager import ThemeManager, list_themes, load_theme_css
+from theme_manager import ThemeManager, list_themes, load_theme_css, _scan_themes
 
 def test_list_themes():
     """Test listing available themes"""
@@ -13,6 +13,27 @@ def test_list_themes():
     assert 'presentation' in themes
     assert len(themes) == 6
 
+def test_list_themes_cached():
+    """Test the themes directory is rescanned only when it changes"""
+    list_themes.cache_clear()
+    first = list_themes()
+
+    assert list_themes() is first
+    assert _scan_themes.cache_info().hits == 1
+
+def test_list_themes_sees_new_theme(tmp_path, monkeypatch):
+    """Test a theme added to the directory shows up on the next call"""
+    import os
+    import theme_manager
+
+    monkeypatch.setattr(theme_manager, "THEMES_DIR", tmp_path)
+    (tmp_path / "plain.css").write_text("")
+    assert list_themes() == ('plain',)
+
+    (tmp_path / "bold.css").write_text("")
+    os.utime(tmp_path, ns=(0, tmp_path.stat().st_mtime_ns + 1))
+    assert list_themes() == ('bold', 'plain')
+
 def test_load_theme_css():
     """Test loading theme CSS"""
     css = load_theme_css('academic')
@@ -25,6 +46,15 @@ def test_load_theme_css_invalid():
     with pytest.raises(FileNotFoundError):
         load_theme_css('nonexistent')
 
+def test_load_theme_css_cached():
+    """Test theme CSS is read from disk once per theme"""
+    load_theme_css.cache_clear()
+    first = load_theme_css('academic')
+    second = load_theme_css('academic')
+
+    assert first is second
+    assert load_theme_css.cache_info().hits == 1
+
 def test_theme_manager_get_mermaid_theme():
     """Test getting Mermaid theme for a given theme"""
     config = {
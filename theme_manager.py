@@ -4,35 +4,64 @@ Theme Manager Module
 Handles theme discovery, CSS loading, and theme-specific configuration.
 """
 
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Dict, Any, Tuple
 
 
-def list_themes() -> List[str]:
+THEMES_DIR = Path(__file__).parent / "themes"
+
+
+def list_themes() -> Tuple[str, ...]:
     """
     List all available themes by scanning the themes directory.
 
+    The scan is cached and only repeated when the directory's mtime
+    changes, so repeated calls cost a single stat and return the same
+    tuple.
+
     Returns:
-        List[str]: List of theme names (without .css extension)
+        Tuple[str, ...]: Sorted theme names (without .css extension)
 
     Example:
         >>> themes = list_themes()
         >>> 'academic' in themes
         True
     """
-    themes_dir = Path(__file__).parent / "themes"
+    try:
+        mtime_ns = os.stat(THEMES_DIR).st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Themes directory not found: {THEMES_DIR}")
+
+    return _scan_themes(str(THEMES_DIR), mtime_ns)
 
-    if not themes_dir.exists():
-        raise FileNotFoundError(f"Themes directory not found: {themes_dir}")
 
-    theme_files = themes_dir.glob("*.css")
-    return sorted([theme_file.stem for theme_file in theme_files])
+@lru_cache(maxsize=1)
+def _scan_themes(themes_dir: str, mtime_ns: int) -> Tuple[str, ...]:
+    """Scan a themes directory once per (path, mtime) pair for sorted theme names."""
+    themes = []
+    with os.scandir(themes_dir) as entries:
+        for entry in entries:
+            # Directories named *.css are not themes; is_file() answers
+            # from the readdir d_type, so this normally needs no stat
+            stem, ext = os.path.splitext(entry.name)
+            if os.path.normcase(ext) == '.css' and stem and entry.is_file():
+                themes.append(stem)
+    return tuple(sorted(themes))
 
 
+list_themes.cache_clear = _scan_themes.cache_clear
+
+
+@lru_cache(maxsize=8)
 def load_theme_css(theme_name: str) -> str:
     """
     Load CSS content for a given theme.
 
+    Each theme is read from disk once per process; call
+    ``load_theme_css.cache_clear()`` to pick up edited theme files.
+
     Args:
         theme_name (str): Name of the theme (without .css extension)
 
@@ -47,17 +76,18 @@ def load_theme_css(theme_name: str) -> str:
         >>> '.markdown-body' in css
         True
     """
-    themes_dir = Path(__file__).parent / "themes"
-    theme_file = themes_dir / f"{theme_name}.css"
+    theme_file = THEMES_DIR / f"{theme_name}.css"
 
-    if not theme_file.exists():
+    # Open directly rather than stat first; the theme list is only
+    # gathered for the error message
+    try:
+        return theme_file.read_text(encoding='utf-8')
+    except FileNotFoundError:
         available_themes = ", ".join(list_themes())
         raise FileNotFoundError(
             f"Theme '{theme_name}' not found. Available themes: {available_themes}"
         )
 
-    return theme_file.read_text(encoding='utf-8')
-
 
 class ThemeManager:
     """